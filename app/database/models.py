@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Float, Text, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.sql import func
 from app.database.db import Base
 
@@ -27,9 +27,14 @@ class Highlight(Base):
 
 class Transcript(Base):
     __tablename__ = "transcripts"
+    __table_args__ = (
+        # Upsert key for save_transcript's ON DUPLICATE KEY UPDATE;
+        # its index also serves video_id-prefix lookups
+        UniqueConstraint("video_id", "start", name="uq_transcripts_video_start"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    video_id = Column(String(64), index=True, nullable=False)
+    video_id = Column(String(64), nullable=False)
 
     start = Column(Float, nullable=False)
     duration = Column(Float, nullable=False)
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from fastapi import APIRouter, Request, Form, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
@@ -7,7 +6,8 @@ from fastapi.templating import Jinja2Templates
 from app.services.youtube import get_video_id
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.db import get_db
-from app.services.transcript import fetch_transcript, save_transcript
+from app.services.transcript import afetch_transcript, save_transcript
+from app.services.editorial_memory import invalidate_editorial_bias_cache
 from app.services.highlight_ai import detect_highlights
 from app.services.user_feedback import submit_clip_feedback
 from app.database.models import VideoAnalysis, Highlight
@@ -44,6 +44,9 @@ async def _save_analysis_and_highlights(
     await session.flush()  # assign highlight ids
     await session.commit()
 
+    # New highlight rows feed the editorial learning layer
+    invalidate_editorial_bias_cache()
+
     # Attach db ids back to response payload for UI feedback submission
     enriched: list[dict] = []
     for h, row in zip(highlights, rows):
@@ -83,8 +86,8 @@ async def analyze(
     if video_id and not error:
         try:
             logs.append("Fetching transcript via pipeline (YouTube API → yt-dlp → Whisper)...")
-            # Fetch transcript off-thread to avoid blocking event loop
-            transcript = await asyncio.to_thread(fetch_transcript, video_id)
+            # Each pipeline stage runs off-thread to avoid blocking event loop
+            transcript = await afetch_transcript(video_id)
             logs.append(f"Transcript fetched: {len(transcript)} segments")
 
             # Save transcript rows in bulk (single commit)
@@ -138,7 +141,7 @@ async def analyze_api(
     if video_id and not error:
         try:
             logs.append("Fetching transcript via pipeline (YouTube API → yt-dlp → Whisper)...")
-            transcript = await asyncio.to_thread(fetch_transcript, video_id)
+            transcript = await afetch_transcript(video_id)
             logs.append(f"Transcript fetched: {len(transcript)} segments")
 
             logs.append("Saving transcript to database (bulk insert)...")
@@ -182,9 +185,9 @@ async def analyze_stream(
             video_id = get_video_id(youtube_url)
             yield _sse("log", f"Video ID detected: {video_id}")
 
-            # Fetch transcript (off-thread)
+            # Fetch transcript (stages run off-thread)
             yield _sse("log", "Fetching transcript via pipeline (YouTube API → yt-dlp → Whisper)...")
-            transcript = await asyncio.to_thread(fetch_transcript, video_id)
+            transcript = await afetch_transcript(video_id)
             yield _sse("log", f"Transcript fetched: {len(transcript)} segments")
 
             # Save transcript
@@ -18,6 +18,7 @@ from typing import Dict, Optional, List, Tuple, Iterable
 from dataclasses import dataclass, field
 
 import json
+import time
 
 
 @dataclass
@@ -531,6 +532,43 @@ def load_editorial_bias(db_session=None) -> EditorialBiasProfile:
     return EditorialBiasProfile()
 
 
+# How long a computed bias profile may be served before re-querying.
+_BIAS_CACHE_TTL_SECONDS = 300.0
+
+# Single-entry cache: (expires_at, profile). The bias profile aggregates
+# global feedback data, so one entry serves every session.
+_bias_cache: Optional[Tuple[float, EditorialBiasProfile]] = None
+
+
+def load_editorial_bias_cached(db_session=None) -> EditorialBiasProfile:
+  """
+  TTL-cached wrapper around load_editorial_bias.
+  
+  detect_highlights reloads the bias profile on every call, but the
+  underlying feedback changes rarely; the computed profile is therefore
+  reused for up to 5 minutes. Callers without a database session still get
+  the zero-bias fast path. After writing feedback that should be picked up
+  immediately, call invalidate_editorial_bias_cache().
+  """
+  global _bias_cache
+  if db_session is None:
+    return EditorialBiasProfile()
+  
+  now = time.monotonic()
+  if _bias_cache is not None and now < _bias_cache[0]:
+    return _bias_cache[1]
+  
+  profile = load_editorial_bias(db_session)
+  _bias_cache = (now + _BIAS_CACHE_TTL_SECONDS, profile)
+  return profile
+
+
+def invalidate_editorial_bias_cache() -> None:
+  """Drop the cached bias profile (call after persisting new highlights/feedback)."""
+  global _bias_cache
+  _bias_cache = None
+
+
 def apply_editorial_bias(
   base_score: int,
   category: str,
@@ -41,83 +41,384 @@ Constraints:
 - Readable, testable, maintainable
 """
 import re
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import List, Dict, Tuple, Optional
 
 from app.services.editorial_memory import (
-  load_editorial_bias,
+  load_editorial_bias_cached,
   apply_editorial_bias,
   EditorialBiasProfile,
   EditorialLearningProfile
 )
 
 
+# Record separator used to clean a whole transcript in one regex pass; never
+# appears in caption text, and the markup patterns below cannot match across it.
+_CAPTION_SEP = "\x1e"
+
+# Timestamp patterns: <HH:MM:SS.mmm> or <MM:SS.mmm> or <SS.mmm>
+_CAPTION_TIMESTAMP_PATTERNS = (
+  re.compile(r'<\d{1,2}:\d{2}:\d{2}\.\d{3}>'),
+  re.compile(r'<\d{1,2}:\d{2}\.\d{3}>'),
+  re.compile(r'<\d{1,2}\.\d{3}>'),
+)
+
+# HTML-like tags: <c>, </c>, <font>, <i>, etc. The character class excludes
+# the record separator so an unterminated tag in one segment cannot swallow
+# the boundary when segments are cleaned as a joined blob.
+_CAPTION_TAG_PATTERN = re.compile(r'</?[a-z]+[^>\x1e]*>', re.IGNORECASE)
+
+
+def _strip_caption_markup(text: str) -> str:
+  """Strip timestamp markers and HTML-like tags from caption text."""
+  for pattern in _CAPTION_TIMESTAMP_PATTERNS:
+    text = pattern.sub('', text)
+  return _CAPTION_TAG_PATTERN.sub('', text)
+
+
+def _normalize_caption_words(text: str) -> str:
+  """Collapse whitespace and drop immediate repeated words (caption overlap).
+
+  Example: "fokus fokus pada" -> "fokus pada"
+  """
+  deduped = []
+  prev = None
+  for word in text.split():
+    word_lower = word.lower()
+    if word_lower != prev:
+      deduped.append(word)
+      prev = word_lower
+  return ' '.join(deduped)
+
+
 def _clean_transcript_text(text: str) -> str:
   """Clean transcript artifacts from auto-caption systems.
-  
+
   Removes:
   - Timestamp patterns: <00:02:02.000>
   - HTML-like tags: <c>, </c>, <font>, etc.
   - Excessive whitespace
   - Duplicated consecutive words (caption overlap artifacts)
-  
+
   Returns clean text ready for analysis.
   """
   if not text:
     return ""
-  
-  # Remove timestamp patterns: <HH:MM:SS.mmm> or <MM:SS.mmm> or <SS.mmm>
-  import re
-  text = re.sub(r'<\d{1,2}:\d{2}:\d{2}\.\d{3}>', '', text)
-  text = re.sub(r'<\d{1,2}:\d{2}\.\d{3}>', '', text)
-  text = re.sub(r'<\d{1,2}\.\d{3}>', '', text)
-  
-  # Remove HTML-like tags: <c>, </c>, <font>, <i>, etc.
-  text = re.sub(r'</?[a-z]+[^>]*>', '', text, flags=re.IGNORECASE)
-  
-  # Normalize whitespace
-  text = ' '.join(text.split())
-  
-  # Deduplicate immediate repeated words (caption overlap)
-  # Example: "fokus fokus pada" -> "fokus pada"
-  words = text.split()
-  deduped = []
-  prev = None
-  for word in words:
-    word_lower = word.lower()
-    if word_lower != prev:
-      deduped.append(word)
-      prev = word_lower
-  
-  return ' '.join(deduped).strip()
+  return _normalize_caption_words(_strip_caption_markup(text))
 
 
-def _tokenize(text: str) -> List[str]:
-  # Simple, library-free tokenizer
-  cleaned = []
-  for ch in text.lower():
-    if ch.isalnum() or ch in {" ", "-"}:
-      cleaned.append(ch)
-    else:
-      cleaned.append(" ")
-  return [w for w in "".join(cleaned).split() if w]
-
-
-def _filler_and_stopwords() -> Tuple[set[str], set[str]]:
-  # Small, hand-curated Indonesian filler/stopword lists.
-  # Keep them short and high-signal to stay deterministic and maintainable.
-  filler = {
-    "eee", "ee", "eh", "em", "umm", "hmm", "nah", "oke", "ok", "ya", "yah",
-    "anu", "gitu", "gini", "kayak", "kaya", "nih", "sih", "deh", "dong", "kan",
-    "aja", "lah", "loh", "lho", "tau", "tahu", "maksudnya",
-  }
-  stop = {
-    "yang", "dan", "atau", "di", "ke", "dari", "untuk", "pada", "itu", "ini", "nya",
-    "saya", "aku", "kita", "kami", "kamu", "lu", "gue", "dia", "mereka",
-    "jadi", "terus", "lalu", "kemudian", "nah", "oke", "karena", "sebab", "biar",
-    "dengan", "dalam", "sebagai", "adalah", "ialah", "akan", "sudah", "udah", "belum",
-    "bisa", "nggak", "tidak", "ga", "gak", "pun", "kok", "juga", "aja", "lagi",
-  }
-  return filler, stop
+def _clean_transcript_texts(texts: List[str]) -> List[str]:
+  """Clean every segment text in one pass.
+
+  Joins the segments with a separator so each markup pattern traverses the
+  transcript once instead of once per segment; word normalization stays
+  per-segment so dedupe never carries across a boundary. Equivalent to
+  mapping _clean_transcript_text over the list.
+  """
+  blob = _strip_caption_markup(_CAPTION_SEP.join(texts))
+  return [_normalize_caption_words(t) for t in blob.split(_CAPTION_SEP)]
+
+
+class _TokenTable(dict):
+  # Translation table for _tokenize: keeps alphanumerics, spaces and hyphens,
+  # maps everything else to a space. Built lazily per codepoint so str.translate
+  # (a single C-level scan) replaces the old per-character Python loop while
+  # keeping identical Unicode isalnum() semantics.
+  def __missing__(self, codepoint: int) -> str:
+    ch = chr(codepoint)
+    kept = ch if (ch.isalnum() or ch in " -") else " "
+    self[codepoint] = kept
+    return kept
+
+
+_TOKEN_TABLE = _TokenTable()
+
+
+@lru_cache(maxsize=4096)
+def _tokenize(text: str) -> Tuple[str, ...]:
+  # Simple, library-free tokenizer. Cached: the scoring/window passes
+  # tokenize the same segment texts many times. Returns a tuple so the
+  # cached value is safe to share between callers.
+  return tuple(text.lower().translate(_TOKEN_TABLE).split())
+
+
+@lru_cache(maxsize=4096)
+def _lower(text: str) -> str:
+  # .lower() allocates a fresh string each call; hot paths share it via cache.
+  return text.lower()
+
+
+@dataclass(frozen=True)
+class _SegView:
+  """Precomputed views of one text: lowered form, tokens and token set.
+
+  The analysis predicates each need some combination of these; sharing a
+  cached view avoids re-lowering/re-tokenizing the same segment text once
+  per predicate during a scoring pass.
+  """
+  raw: str
+  lower: str
+  tokens: Tuple[str, ...]
+  token_set: frozenset
+
+
+@lru_cache(maxsize=4096)
+def _view(text: str) -> _SegView:
+  lower = text.strip().lower()
+  tokens = tuple(_tokenize(lower))
+  return _SegView(text, lower, tokens, frozenset(tokens))
+
+
+def _filler_and_stopwords() -> Tuple[frozenset, frozenset]:
+  # Kept for callers that want both lists; the constants live at module scope.
+  return _FILLER_WORDS, _STOP_WORDS
+
+
+# ============================================================
+# LEXICONS (module-level frozensets, allocated once at import)
+# ============================================================
+# These were previously rebuilt as set literals inside every call, paying
+# the allocation + per-string hashing cost per scored segment.
+
+# Hand-curated Indonesian filler/stopword lists.
+# Keep them short and high-signal to stay deterministic and maintainable.
+_FILLER_WORDS = frozenset({
+  "eee", "ee", "eh", "em", "umm", "hmm", "nah", "oke", "ok", "ya", "yah",
+  "anu", "gitu", "gini", "kayak", "kaya", "nih", "sih", "deh", "dong", "kan",
+  "aja", "lah", "loh", "lho", "tau", "tahu", "maksudnya",
+})
+_STOP_WORDS = frozenset({
+  "yang", "dan", "atau", "di", "ke", "dari", "untuk", "pada", "itu", "ini", "nya",
+  "saya", "aku", "kita", "kami", "kamu", "lu", "gue", "dia", "mereka",
+  "jadi", "terus", "lalu", "kemudian", "nah", "oke", "karena", "sebab", "biar",
+  "dengan", "dalam", "sebagai", "adalah", "ialah", "akan", "sudah", "udah", "belum",
+  "bisa", "nggak", "tidak", "ga", "gak", "pun", "kok", "juga", "aja", "lagi",
+})
+
+# Punchline signals (_is_punchline)
+_STRONG_OPENERS = (
+  "masalahnya", "kenyataannya", "faktanya", "intinya", "kuncinya",
+  "sebenarnya", "artinya", "poinnya", "kesalahannya", "solusinya",
+)
+_ABSOLUTE_LANGUAGE = frozenset({
+  "selalu", "kebanyakan", "semua", "pasti", "cuma", "hanya", "satu-satunya",
+  "never", "nggak", "tidak", "gak", "ga", "bukan", "tanpa",
+})
+_POLAR_PHRASES = (
+  "tidak pernah", "nggak pernah", "gak pernah", "gak ada", "tidak ada",
+)
+_PUNCH_VERBS = frozenset({"harus", "wajib", "jangan", "berhenti", "fokus", "ingat", "pastikan", "hindari"})
+
+# Sentence-boundary signals (_is_hanging_start / _is_incomplete_end)
+_HANGING_STARTS = (
+  "jadi", "karena", "kalau", "terus", "lalu", "kemudian",
+  "makanya", "soalnya", "tapi", "namun", "atau", "dan",
+  "sebab", "maka", "sehingga", "nah", "oke",
+)
+_INCOMPLETE_ENDINGS = frozenset({
+  "karena", "kalau", "jadi", "makanya", "yaitu", "seperti",
+  "adalah", "itu", "ini", "artinya", "berarti",
+})
+_QUESTION_END_MARKERS = ("hah", "pertanyaannya", "kenapa", "bagaimana")
+
+# Educational signals (_is_educational_content / completeness checks)
+_UNITS = frozenset({
+  "gram", "kilogram", "kg", "liter", "meter", "km", "cm",
+  "persen", "percent", "%", "kali", "bagi", "dikali", "dibagi",
+  "ribu", "juta", "miliar", "rupiah", "dollar",
+})
+_PREMISE_MARKERS = frozenset({
+  "kalau", "jika", "misalnya", "contoh", "kita", "ada", "punya",
+  "awalnya", "pertama", "mulai",
+})
+_TRANSFORMATION_MARKERS = frozenset({
+  "kali", "bagi", "dikali", "dibagi", "tambah", "kurang",
+  "artinya", "berarti", "jadi", "setara", "sama",
+})
+_CONCLUSION_MARKERS = frozenset({
+  "jadi", "hasilnya", "kesimpulannya", "artinya", "berarti",
+  "itulah", "makanya", "sehingga", "maka",
+})
+_EDU_REASONING_MARKERS = frozenset({"artinya", "berarti", "jadi", "makanya", "hasilnya", "itulah", "begitulah"})
+
+# Emotion lexicon (_emotional_signal_score): keep small, high-precision.
+_FEAR_URGENCY = frozenset({
+  "takut", "khawatir", "cemas", "panik", "bahaya", "ancam", "darurat", "segera", "urgent", "krusial",
+  "parah", "fatal", "berisiko", "resiko", "hancur",
+})
+_SUCCESS_RELIEF = frozenset({
+  "berhasil", "sukses", "menang", "naik", "tembus", "lega", "akhirnya", "tenang", "selamat",
+})
+_FAILURE_FRUSTRATION = frozenset({
+  "gagal", "kecewa", "frustrasi", "capek", "lelah", "stress", "stres", "marah", "kesal", "kacau",
+  "susah", "sulit", "berantakan", "nyesel", "menyerah",
+})
+
+# Core editorial lexicons (_score_text / _calculate_core_editorial_pass)
+_CORE_KEYWORDS = frozenset({
+  "penting", "kunci", "kuncinya", "masalah", "solusi", "kesalahan",
+  "intinya", "sebenarnya", "faktanya", "kenyataannya", "artinya",
+})
+_CORE_PASS_KEYWORDS = frozenset({
+  "penting", "kunci", "kuncinya", "masalah", "solusi", "kesalahan",
+  "intinya", "sebenarnya", "faktanya", "kenyataannya", "rahasia",
+})
+_IMPERATIVE_MARKERS = frozenset({"harus", "wajib", "jangan", "pastikan", "ingat", "fokus", "hindari"})
+_CORE_OPENERS = ("masalahnya", "kuncinya", "intinya", "sebenarnya", "faktanya", "kenyataannya", "solusinya")
+_EMPHASIS_STARTS = (
+  "jadi", "intinya", "yang paling", "ingat", "sebenarnya", "singkatnya",
+  "poin", "kunci", "masalahnya",
+)
+_FIRST_PERSON = frozenset({"saya", "aku", "kita", "kami", "gue"})
+_CLAIM_WORDS = frozenset({"kunci", "penting", "masalah", "solusi", "harus", "jangan", "intinya"})
+_SUPPORT_WORDS = frozenset({"karena", "sebab", "soalnya", "makanya", "jadi", "biar", "supaya"})
+_QUESTION_STARTS = ("apa", "mengapa", "kenapa", "bagaimana", "kapan", "dimana", "berapa")
+_ANSWER_MARKERS = frozenset({"karena", "jawabannya", "ternyata", "sebenarnya", "faktanya"})
+_STORYTELLING_MARKERS = frozenset({
+  "waktu", "dulu", "pas", "kemarin", "terus", "lalu", "kemudian", "abis", "habis",
+})
+
+# Classification lexicons (_classify)
+_IMPERATIVE_SIGNALS = frozenset({"harus", "wajib", "jangan", "pastikan", "ingat", "fokus", "hindari", "lakukan"})
+_WARNING_SIGNALS = frozenset({
+  "bahaya", "risiko", "resiko", "ancaman", "masalah", "kesalahan",
+  "salah", "fatal", "hancur", "rugi", "gagal", "kacau", "berantakan",
+})
+_PAST_TENSE = frozenset({"dulu", "waktu", "pengalaman", "pelajaran", "ternyata"})
+_LESSON_FIRST_PERSON = frozenset({"saya", "aku", "gue", "kita"})
+_INSIGHT_SIGNALS = frozenset({
+  "kunci", "kuncinya", "intinya", "sebenarnya", "faktanya",
+  "kenyataannya", "artinya", "poinnya", "alasannya",
+})
+_MOTIVATIONAL_SIGNALS = frozenset({
+  "semangat", "percaya", "yakin", "pasti", "bisa", "sukses",
+  "berhasil", "terus", "lanjut", "jangan", "menyerah",
+})
+
+# Window-trimming lexicons (_build_window_around)
+_FILLER_STARTS = ("jadi", "nah", "oke", "ok", "ya", "eee", "eh", "em", "hmm", "terus", "lalu")
+_FILLER_ENDS = frozenset({"ya", "yah", "kan", "dong", "deh", "sih", "gitu", "gini", "nih"})
+
+# Single-pass lexicon scan for _score_text. Instead of intersecting the token
+# set with each lexicon separately, every keyword carries a bitmask of the
+# lexicons it belongs to; one walk over the tokens ORs the masks together and
+# each "does this text hit lexicon X" question becomes a bit test.
+_HIT_CORE = 1 << 0
+_HIT_IMPERATIVE = 1 << 1
+_HIT_REASONING = 1 << 2
+_HIT_FIRST_PERSON = 1 << 3
+_HIT_CLAIM = 1 << 4
+_HIT_SUPPORT = 1 << 5
+_HIT_ANSWER = 1 << 6
+_HIT_STORY = 1 << 7
+_HIT_CORE_PASS = 1 << 8
+
+
+def _build_lexicon_masks() -> Dict[str, int]:
+  masks: Dict[str, int] = {}
+  for bit, lexicon in (
+      (_HIT_CORE, _CORE_KEYWORDS),
+      (_HIT_IMPERATIVE, _IMPERATIVE_MARKERS),
+      (_HIT_REASONING, _EDU_REASONING_MARKERS),
+      (_HIT_FIRST_PERSON, _FIRST_PERSON),
+      (_HIT_CLAIM, _CLAIM_WORDS),
+      (_HIT_SUPPORT, _SUPPORT_WORDS),
+      (_HIT_ANSWER, _ANSWER_MARKERS),
+      (_HIT_STORY, _STORYTELLING_MARKERS),
+      (_HIT_CORE_PASS, _CORE_PASS_KEYWORDS),
+  ):
+    for word in lexicon:
+      masks[word] = masks.get(word, 0) | bit
+  return masks
+
+
+_LEXICON_MASKS = _build_lexicon_masks()
+
+
+# ============================================================
+# PRECOMPILED PATTERNS (module-level, compiled once at import)
+# ============================================================
+# The scoring helpers run these patterns once per scored segment/window.
+# Compiling at import time avoids the re-module cache lookup (and potential
+# recompilation under cache pressure) on every call. Each list is fused into
+# one alternation so a membership-style check is a single .search() instead
+# of one regex dispatch per pattern.
+
+
+def _union(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+  return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
+# Declarative claim markers used by _score_text
+_DECLARATIVE_RE = _union((
+  r"\bkunci(nya)?\s+(itu\s+)?adalah\b",
+  r"\bintinya\s+(itu\s+)?\b",
+  r"\bartinya\s+\b",
+  r"\byang\s+terjadi\s+(itu\s+)?adalah\b",
+  r"\bpoin(nya)?\s+(itu\s+)?\b",
+  r"\bpelajaran(nya)?\s+(itu\s+)?\b",
+  r"\bmasalah\s+utamanya\s+(itu\s+)?\b",
+  r"\bsolusi(nya)?\s+(itu\s+)?\b",
+  r"\bfakta(nya)?\s+(itu\s+)?\b",
+  r"\bkenyataan(nya)?\s+(itu\s+)?\b",
+))
+
+# Declarative claim markers used by _calculate_core_editorial_pass
+_CORE_DECLARATIVE_RE = _union((
+  r"\bkunci(nya)?\s+(itu\s+)?adalah\b",
+  r"\bintinya\s+(itu\s+)?\b",
+  r"\bartinya\s+\b",
+  r"\bfakta(nya)?\s+(itu\s+)?\b",
+  r"\bkenyataan(nya)?\s+(itu\s+)?\b",
+  r"\bmasalah(nya)?\s+(itu\s+)?adalah\b",
+  r"\bsolusi(nya)?\s+(itu\s+)?\b",
+  r"\brahasia(nya)?\s+\w+\s+(itu|adalah)\b",  # "rahasia sukses itu/adalah"
+  r"\bsebenarnya\s+\w+\s+(itu|adalah)\b",     # "sebenarnya X itu/adalah"
+))
+
+# Mathematical/reasoning phrases used by _is_educational_content
+_REASONING_RE = _union((
+  r"\bkalau\s+.+\s+maka\b",
+  r"\bjika\s+.+\s+maka\b",
+  r"\bartinya\b",
+  r"\bberarti\b",
+  r"\bsetara\s+dengan\b",
+  r"\bsama\s+dengan\b",
+))
+
+# Conclusion phrasing used by _check_informational_completeness
+_CONCLUSION_RE = _union((
+  r"\bjadi\s+.+\s+(adalah|itu)\b",
+  r"\bartinya\s+.+\b",
+  r"\bberarti\s+.+\b",
+))
+
+# Category patterns used by _classify
+_CAUTION_RE = _union((
+  r"\bhati-?hati\b",
+  r"\bkalau\s+(tidak|nggak|gak)\b",
+  r"\bjangan\s+sampai\b",
+))
+_LESSON_RE = _union((
+  r"\bsaya\s+(belajar|dapat|dapet)\b",
+  r"\bpengalaman\s+saya\b",
+  r"\bdulu\s+saya\b",
+  r"\bwaktu\s+(itu\s+)?saya\b",
+  r"\bpelajaran(nya)?\b",
+))
+_INSIGHT_RE = _union((
+  r"\byang\s+penting\b",
+  r"\byang\s+perlu\b",
+  r"\bmasalah\s+utama\b",
+))
+_MOTIVATIONAL_RE = _union((
+  r"\bkamu\s+bisa\b",
+  r"\bpasti\s+bisa\b",
+  r"\bjangan\s+menyerah\b",
+))
 
 
 def _is_punchline(text: str) -> bool:
@@ -130,11 +431,12 @@ def _is_punchline(text: str) -> bool:
   
   Returns True if text is a strong standalone statement suitable as clip anchor.
   """
-  t = (text or "").strip().lower()
+  v = _view(text or "")
+  t = v.lower
   if not t:
     return False
 
-  words = _tokenize(t)
+  words = v.tokens
   n = len(words)
   
   # Editorial: allow more flexibility (6-18 words) instead of rigid 5-12
@@ -142,33 +444,24 @@ def _is_punchline(text: str) -> bool:
   if n < 6 or n > 18:
     return False
 
-  # Assertive openers - signal a definitive claim
-  strong_openers = (
-    "masalahnya", "kenyataannya", "faktanya", "intinya", "kuncinya",
-    "sebenarnya", "artinya", "poinnya", "kesalahannya", "solusinya",
-  )
-  
-  # Absolute/definitive language - signals strong claim
-  absolute_language = {
-    "selalu", "kebanyakan", "semua", "pasti", "cuma", "hanya", "satu-satunya",
-    "never", "nggak", "tidak", "gak", "ga", "bukan", "tanpa",
-  }
-  
-  polar_phrases = (
-    "tidak pernah", "nggak pernah", "gak pernah", "gak ada", "tidak ada",
-  )
-  
-  # Imperative/instructional verbs - signal actionable advice
-  punch_verbs = {"harus", "wajib", "jangan", "berhenti", "fokus", "ingat", "pastikan", "hindari"}
+  has_opener = t.startswith(_STRONG_OPENERS)
+  has_absolute = any(w in _ABSOLUTE_LANGUAGE for w in words) or any(p in t for p in _POLAR_PHRASES)
+  has_take = any(w in _PUNCH_VERBS for w in words)
+
+  # The emotion check is the most expensive signal (re-tokenizes + lexicon scan),
+  # so only compute it when the cheaper signals haven't already decided the outcome.
+  prelim = int(has_opener) + int(has_absolute) + int(has_take)
+  if prelim >= 2:
+    return True
+  if prelim == 0 and n > 12:
+    # Even with an emotion signal, one signal alone can't qualify at this length.
+    return False
 
-  has_opener = t.startswith(strong_openers)
-  has_absolute = any(w in absolute_language for w in words) or any(p in t for p in polar_phrases)
-  has_take = any(w in punch_verbs for w in words)
   has_emotion = _emotional_signal_score(t)[0] > 0
 
   # Require at least ONE strong signal for a statement to qualify as punchline
-  signal_count = sum([has_opener, has_absolute, has_take, has_emotion])
-  
+  signal_count = prelim + int(has_emotion)
+
   # If 2+ signals present, it's definitely a punchline
   # If 1 signal + reasonably short (6-12 words), also qualifies
   return signal_count >= 2 or (signal_count >= 1 and 6 <= n <= 12)
@@ -193,8 +486,21 @@ def _adaptive_peak_threshold(seg_scores: List[int]) -> int:
   """Adaptive threshold so flat transcripts still yield highlights, while spiky ones remain selective."""
   if not seg_scores:
     return 2
-  p75 = _quantile(seg_scores, 0.75)
-  p50 = _quantile(seg_scores, 0.50)
+
+  # Sort once and read both quantiles from the same sorted array
+  # (calling _quantile twice would sort twice).
+  xs = sorted(seg_scores)
+
+  def q(frac: float) -> float:
+    if len(xs) == 1:
+      return float(xs[0])
+    pos = (len(xs) - 1) * frac
+    lo = int(pos)
+    hi = min(len(xs) - 1, lo + 1)
+    return xs[lo] * (1.0 - (pos - lo)) + xs[hi] * (pos - lo)
+
+  p75 = q(0.75)
+  p50 = q(0.50)
   # Base threshold near upper quartile, but not too strict.
   thr = int(round(max(2.0, min(6.0, p75))))
   # If distribution is flat (p75 close to median), lower slightly.
@@ -203,6 +509,37 @@ def _adaptive_peak_threshold(seg_scores: List[int]) -> int:
   return thr
 
 
+# Reason ordering for _compress_reasons: most editorially meaningful first.
+# The rank dict gives O(1) lookup for exact matches; prefix matches (reasons
+# with appended detail, e.g. "Durasi optimal (20s)") fall back to a scan.
+_REASON_PRIORITY = (
+  "Punchline berkualitas",
+  "Punchline",
+  "Hook di awal (ideal)",
+  "Pernyataan deklaratif kuat",
+  "Nada instruktif/tegas",
+  "Mengandung kata kunci editorial",
+  "Meaning density tinggi",
+  "Sinyal urgensi/risiko",
+  "Sinyal gagal/frustrasi",
+  "Sinyal sukses/lega",
+  "Awalan penekanan",
+  "Claim+justifikasi",
+  "Durasi optimal",
+)
+_REASON_RANK = {p: i for i, p in enumerate(_REASON_PRIORITY)}
+
+
+def _reason_rank(reason: str) -> int:
+  rank = _REASON_RANK.get(reason)
+  if rank is not None:
+    return rank
+  for prefix, i in _REASON_RANK.items():
+    if reason.startswith(prefix):
+      return i
+  return len(_REASON_PRIORITY)
+
+
 def _compress_reasons(reasons: List[str], limit: int = 3) -> List[str]:
   """Deduplicate and keep the most meaningful reasons.
 
@@ -222,37 +559,10 @@ def _compress_reasons(reasons: List[str], limit: int = 3) -> List[str]:
     seen.add(key)
     deduped.append(r)
 
-  priority = [
-    "Punchline berkualitas",
-    "Punchline",
-    "Hook di awal (ideal)",
-    "Pernyataan deklaratif kuat",
-    "Nada instruktif/tegas",
-    "Mengandung kata kunci editorial",
-    "Meaning density tinggi",
-    "Sinyal urgensi/risiko",
-    "Sinyal gagal/frustrasi",
-    "Sinyal sukses/lega",
-    "Awalan penekanan",
-    "Claim+justifikasi",
-    "Durasi optimal",
-  ]
-
-  picked: List[str] = []
-  for p in priority:
-    for r in deduped:
-      if r == p or r.startswith(p):
-        if r not in picked:
-          picked.append(r)
-          if len(picked) >= limit:
-            return picked
-
-  for r in deduped:
-    if len(picked) >= limit:
-      break
-    if r not in picked:
-      picked.append(r)
-  return picked
+  # Stable sort by priority rank keeps insertion order within equal ranks,
+  # which matches the old nested priority/fill loops.
+  deduped.sort(key=_reason_rank)
+  return deduped[:limit]
 
 
 def _is_hanging_start(text: str) -> bool:
@@ -262,17 +572,11 @@ def _is_hanging_start(text: str) -> bool:
   """
   if not text:
     return True
-  
-  text_lower = text.strip().lower()
-  
+
+  text_lower = _view(text).lower
+
   # Conjunctions and connectors that signal incomplete thought
-  hanging_starts = (
-    "jadi", "karena", "kalau", "terus", "lalu", "kemudian",
-    "makanya", "soalnya", "tapi", "namun", "atau", "dan",
-    "sebab", "maka", "sehingga", "nah", "oke",
-  )
-  
-  return text_lower.startswith(hanging_starts)
+  return text_lower.startswith(_HANGING_STARTS)
 
 
 def _is_incomplete_end(text: str) -> bool:
@@ -282,28 +586,22 @@ def _is_incomplete_end(text: str) -> bool:
   """
   if not text:
     return True
-  
-  text_lower = text.strip().lower()
-  
-  # Endings that signal continuation
-  incomplete_endings = (
-    "karena", "kalau", "jadi", "makanya", "yaitu", "seperti",
-    "yaitu", "adalah", "itu", "ini", "artinya", "berarti",
-  )
-  
+
+  v = _view(text)
+  text_lower = v.lower
+
   # Questions without answers signal incompleteness
-  question_markers = ("hah", "pertanyaannya", "kenapa", "bagaimana")
-  if any(text_lower.endswith(q) for q in question_markers):
+  if any(text_lower.endswith(q) for q in _QUESTION_END_MARKERS):
     return True
   if "?" in text:
     return True
-  
-  words = _tokenize(text_lower)
+
+  words = v.tokens
   if not words:
     return True
   
   last_word = words[-1]
-  return last_word in incomplete_endings
+  return last_word in _INCOMPLETE_ENDINGS
 
 
 def _is_educational_content(text: str) -> bool:
@@ -319,31 +617,19 @@ def _is_educational_content(text: str) -> bool:
   """
   if not text:
     return False
-  
-  text_lower = text.strip().lower()
-  words = _tokenize(text_lower)
-  
+
+  v = _view(text)
+  text_lower = v.lower
+  words = v.token_set
+
   # Check for numbers (digits in text)
   has_numbers = any(char.isdigit() for char in text)
   
   # Units and measurements
-  units = {
-    "gram", "kilogram", "kg", "liter", "meter", "km", "cm",
-    "persen", "percent", "%", "kali", "bagi", "dikali", "dibagi",
-    "ribu", "juta", "miliar", "rupiah", "dollar",
-  }
-  has_units = any(u in words for u in units)
+  has_units = any(u in words for u in _UNITS)
   
   # Mathematical/reasoning phrases
-  reasoning_phrases = [
-    r"\bkalau\s+.+\s+maka\b",
-    r"\bjika\s+.+\s+maka\b",
-    r"\bartinya\b",
-    r"\bberarti\b",
-    r"\bsetara\s+dengan\b",
-    r"\bsama\s+dengan\b",
-  ]
-  has_reasoning = any(re.search(p, text_lower) for p in reasoning_phrases)
+  has_reasoning = bool(_REASONING_RE.search(text_lower))
   
   # Educational signal: numbers + units OR numbers + reasoning
   is_educational = (has_numbers and has_units) or (has_numbers and has_reasoning)
@@ -371,7 +657,8 @@ def _check_informational_completeness(window_segments: List[str]) -> Tuple[bool,
     return False, "Empty window"
   
   combined_text = " ".join(window_segments).lower()
-  
+  combined_tokens = _view(combined_text).token_set
+
   # Check if this is educational content
   is_edu = _is_educational_content(combined_text)
   
@@ -379,31 +666,14 @@ def _check_informational_completeness(window_segments: List[str]) -> Tuple[bool,
     # Educational clips need premise + transformation + conclusion
     
     # Check for premise (setup, context)
-    premise_markers = {
-      "kalau", "jika", "misalnya", "contoh", "kita", "ada", "punya",
-      "awalnya", "pertama", "mulai",
-    }
-    has_premise = any(w in _tokenize(combined_text) for w in premise_markers)
-    
+    has_premise = any(w in combined_tokens for w in _PREMISE_MARKERS)
+
     # Check for transformation (calculation, reasoning)
-    transformation_markers = {
-      "kali", "bagi", "dikali", "dibagi", "tambah", "kurang",
-      "artinya", "berarti", "jadi", "setara", "sama",
-    }
-    has_transformation = any(w in _tokenize(combined_text) for w in transformation_markers)
-    
+    has_transformation = any(w in combined_tokens for w in _TRANSFORMATION_MARKERS)
+
     # Check for conclusion (result, implication)
-    conclusion_markers = {
-      "jadi", "hasilnya", "kesimpulannya", "artinya", "berarti",
-      "itulah", "makanya", "sehingga", "maka",
-    }
-    conclusion_patterns = [
-      r"\bjadi\s+.+\s+(adalah|itu)\b",
-      r"\bartinya\s+.+\b",
-      r"\bberarti\s+.+\b",
-    ]
-    has_conclusion = (any(w in _tokenize(combined_text) for w in conclusion_markers) or
-                     any(re.search(p, combined_text) for p in conclusion_patterns))
+    has_conclusion = (any(w in combined_tokens for w in _CONCLUSION_MARKERS) or
+                     bool(_CONCLUSION_RE.search(combined_text)))
     
     # Educational content must have at least transformation + conclusion
     # Premise is helpful but not always explicitly stated
@@ -508,7 +778,7 @@ def _has_insight_structure(text: str) -> Tuple[bool, List[str]]:
   return passes, reasons
 
 
-def _detect_educational_sequences(transcript: List[Dict], min_length: int = 3) -> List[int]:
+def _detect_educational_sequences(transcript: List[Dict], min_length: int = 3, texts: Optional[List[str]] = None) -> List[int]:
   """Detect educational sequences where multiple segments form a complete explanation.
   
   Educational content often has low-scoring individual segments (context-dependent,
@@ -519,34 +789,36 @@ def _detect_educational_sequences(transcript: List[Dict], min_length: int = 3) -
   """
   if len(transcript) < min_length:
     return []
-  
+
   n = len(transcript)
+
+  # Precompute per-segment flags once; the scan below then only reads arrays
+  # instead of re-running _is_educational_content/_tokenize per candidate.
+  if texts is None:
+    texts = [str(seg.get("text", "")) for seg in transcript]
+  is_edu_flags = [_is_educational_content(t) for t in texts]
+  reasoning_markers = ("jadi", "artinya", "berarti", "hasilnya", "itulah")
+  has_reasoning_flags = [any(m in t.lower() for m in reasoning_markers) for t in texts]
+  short_connector_flags = [len(_tokenize(t)) < 5 for t in texts]
+
   sequences = []
   i = 0
-  
+
   while i < n:
     # Check if current segment starts an educational sequence
-    seg_text = str(transcript[i].get("text", ""))
-    
-    if _is_educational_content(seg_text):
+    if is_edu_flags[i]:
       # Found potential start - check next few segments
-      sequence_texts = [seg_text]
+      sequence_texts = [texts[i]]
       j = i + 1
-      
+
       # Collect consecutive educational or related segments (max 8 segments, ~30s)
+      # Continue sequence if:
+      # 1. Also educational, OR
+      # 2. Contains reasoning/conclusion markers, OR
+      # 3. Short connector segment (< 5 words)
       while j < n and j < i + 8:
-        next_text = str(transcript[j].get("text", ""))
-        
-        # Continue sequence if:
-        # 1. Also educational, OR
-        # 2. Contains reasoning/conclusion markers, OR
-        # 3. Short connector segment (< 5 words)
-        is_edu = _is_educational_content(next_text)
-        has_reasoning = any(m in next_text.lower() for m in ["jadi", "artinya", "berarti", "hasilnya", "itulah"])
-        is_short_connector = len(_tokenize(next_text)) < 5
-        
-        if is_edu or has_reasoning or is_short_connector:
-          sequence_texts.append(next_text)
+        if is_edu_flags[j] or has_reasoning_flags[j] or short_connector_flags[j]:
+          sequence_texts.append(texts[j])
           j += 1
         else:
           break
@@ -564,220 +836,98 @@ def _detect_educational_sequences(transcript: List[Dict], min_length: int = 3) -
   return sequences
 
 
-def _dynamic_window_profile(anchor_text: str, learning_profile: Optional[EditorialLearningProfile] = None) -> Tuple[Dict[str, float], List[str]]:
-  """Pick window sizing based on the anchor's category and punchiness.
-
-  Editorial intent:
-  - Punchline: short & tight (8-18s) - ONLY exception to duration rules
-  - Educational: LONG (18-35s MINIMUM) - needs complete premise + reasoning + conclusion
-  - Hard advice: medium (12-25s) - actionable and crisp
-  - Warning: medium (15-30s) - need context for risk/consequence
-  - Lesson learned: medium-long (15-35s) - story needs breathing room
-  - Insight: medium (12-30s) - explanation with clarity
-  - Motivational: medium-short (12-25s) - punchy inspiration
-  
-  CRITICAL: min_duration is HARD MINIMUM - never produce shorter clips
-  All clips capped at 60s max (enforced elsewhere).
-  """
-  profile_reasons: List[str] = []
-
-  if _is_punchline(anchor_text):
-    prof = {
-      "min_duration": 8.0,  # ONLY category allowed to be under 10s
-      "max_duration": 18.0,
-      "pre_roll": 0.5,  # Minimal pre-roll for punchlines
-      "post_roll": 1.0,
-      "max_pre_context": 4.0,   # Aggressively trim before anchor
-      "max_post_context": 6.0,  # Allow extension for complete thought
-    }
-    category_key = "punchline"
-    # Apply bounded learning adjustments
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(1.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(3.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-
-    return prof, _compress_reasons(profile_reasons, limit=2)
-
-  cat = _classify(anchor_text)
-  
-  # EDUCATIONAL clips need longer duration for informational completeness
-  # SHORT EDUCATIONAL CLIPS ARE FORBIDDEN - they confuse rather than educate
-  if cat == "educational":
-    prof = {
-      "min_duration": 18.0,  # HARD MINIMUM - never allow shorter (preferred 20s+)
-      "max_duration": 35.0,  # Allow longer for complete explanations
-      "pre_roll": 0.8,  # Need context (premise)
-      "post_roll": 1.0,
-      "max_pre_context": 12.0,  # More context allowed
-      "max_post_context": 20.0,  # Strongly favor post-context (explanation/resolution)
-    }
-    category_key = "educational"
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(3.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(8.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-    return prof, _compress_reasons(profile_reasons, limit=2)
-  
-  if cat == "hard_advice":
-    prof = {
-      "min_duration": 12.0,
-      "max_duration": 25.0,
-      "pre_roll": 0.5,  # Reduced pre-roll
-      "post_roll": 1.0,
-      "max_pre_context": 5.0,
-      "max_post_context": 10.0,  # Increased for complete thoughts
-    }
-    category_key = "hard_advice"
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(1.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(6.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-    return prof, _compress_reasons(profile_reasons, limit=2)
-  
-  if cat == "warning":
-    prof = {
-      "min_duration": 15.0,  # HARD MINIMUM - need full context
-      "max_duration": 30.0,
-      "pre_roll": 0.5,  # Reduced pre-roll
-      "post_roll": 1.0,
-      "max_pre_context": 8.0,
-      "max_post_context": 15.0,  # Favor consequences/resolution
-    }
-    category_key = "warning"
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(2.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(8.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-    return prof, _compress_reasons(profile_reasons, limit=2)
-  
-  if cat == "lesson_learned":
-    prof = {
-      "min_duration": 15.0,  # HARD MINIMUM - need story arc
-      "max_duration": 35.0,
-      "pre_roll": 0.8,
-      "post_roll": 1.0,
-      "max_pre_context": 10.0,
-      "max_post_context": 18.0,  # Strongly favor resolution/lesson
-    }
-    category_key = "lesson_learned"
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(3.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(10.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-    return prof, _compress_reasons(profile_reasons, limit=2)
-  
-  if cat == "motivational":
-    prof = {
-      "min_duration": 12.0,  # HARD MINIMUM
-      "max_duration": 25.0,
-      "pre_roll": 0.5,  # Reduced pre-roll
-      "post_roll": 1.0,
-      "max_pre_context": 5.0,
-      "max_post_context": 12.0,  # Favor motivational payoff
-    }
-    category_key = "motivational"
-    if learning_profile is not None and not learning_profile.is_zero():
-      dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
-      dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
-      dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
-      dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
-      if dmin > 0:
-        prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dmax < 0:
-        prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
-        profile_reasons.append("Sesuai preferensi durasi pengguna")
-      if dpre != 0:
-        prof["max_pre_context"] = max(1.0, prof["max_pre_context"] + dpre)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-      if dpost != 0:
-        prof["max_post_context"] = max(6.0, prof["max_post_context"] + dpost)
-        profile_reasons.append("Disesuaikan dari feedback pengguna")
-    return prof, _compress_reasons(profile_reasons, limit=2)
-  
-  # Default: insight
-  prof = {
+# Base window profiles by category. Values mirror the editorial intent
+# documented on _dynamic_window_profile; "punchline" is a pseudo-category that
+# takes precedence over classification.
+_BASE_WINDOW_PROFILES: Dict[str, Dict[str, float]] = {
+  "punchline": {
+    "min_duration": 8.0,  # ONLY category allowed to be under 10s
+    "max_duration": 18.0,
+    "pre_roll": 0.5,  # Minimal pre-roll for punchlines
+    "post_roll": 1.0,
+    "max_pre_context": 4.0,   # Aggressively trim before anchor
+    "max_post_context": 6.0,  # Allow extension for complete thought
+  },
+  "educational": {
+    "min_duration": 18.0,  # HARD MINIMUM - never allow shorter (preferred 20s+)
+    "max_duration": 35.0,  # Allow longer for complete explanations
+    "pre_roll": 0.8,  # Need context (premise)
+    "post_roll": 1.0,
+    "max_pre_context": 12.0,  # More context allowed
+    "max_post_context": 20.0,  # Strongly favor post-context (explanation/resolution)
+  },
+  "hard_advice": {
+    "min_duration": 12.0,
+    "max_duration": 25.0,
+    "pre_roll": 0.5,  # Reduced pre-roll
+    "post_roll": 1.0,
+    "max_pre_context": 5.0,
+    "max_post_context": 10.0,  # Increased for complete thoughts
+  },
+  "warning": {
+    "min_duration": 15.0,  # HARD MINIMUM - need full context
+    "max_duration": 30.0,
+    "pre_roll": 0.5,  # Reduced pre-roll
+    "post_roll": 1.0,
+    "max_pre_context": 8.0,
+    "max_post_context": 15.0,  # Favor consequences/resolution
+  },
+  "lesson_learned": {
+    "min_duration": 15.0,  # HARD MINIMUM - need story arc
+    "max_duration": 35.0,
+    "pre_roll": 0.8,
+    "post_roll": 1.0,
+    "max_pre_context": 10.0,
+    "max_post_context": 18.0,  # Strongly favor resolution/lesson
+  },
+  "motivational": {
+    "min_duration": 12.0,  # HARD MINIMUM
+    "max_duration": 25.0,
+    "pre_roll": 0.5,  # Reduced pre-roll
+    "post_roll": 1.0,
+    "max_pre_context": 5.0,
+    "max_post_context": 12.0,  # Favor motivational payoff
+  },
+  "insight": {
     "min_duration": 12.0,  # HARD MINIMUM - need complete explanation
     "max_duration": 30.0,
     "pre_roll": 0.5,  # Reduced pre-roll
     "post_roll": 1.0,
     "max_pre_context": 8.0,
     "max_post_context": 15.0,  # Favor explanation/reasoning
-  }
+  },
+}
+
+# Per-category floors for the learning-adjusted context limits:
+# (max_pre_context floor, max_post_context floor).
+_CONTEXT_FLOORS: Dict[str, Tuple[float, float]] = {
+  "punchline": (1.0, 3.0),
+  "educational": (3.0, 8.0),
+  "hard_advice": (1.0, 6.0),
+  "warning": (2.0, 8.0),
+  "lesson_learned": (3.0, 10.0),
+  "motivational": (1.0, 6.0),
+  "insight": (2.0, 8.0),
+}
+
+# One cached (profile, reasons) entry per category, tagged with the learning
+# profile it was computed against. A detect_highlights run uses a single
+# learning profile, so every anchor of the same category hits the cache.
+_PROFILE_CACHE: Dict[str, Tuple[Optional[EditorialLearningProfile], Dict[str, float], List[str]]] = {}
+
+
+def _window_profile_for(category_key: str, learning_profile: Optional[EditorialLearningProfile]) -> Tuple[Dict[str, float], List[str]]:
+  """Build the window profile for one category, with bounded learning deltas."""
+  prof = dict(_BASE_WINDOW_PROFILES[category_key])
+  profile_reasons: List[str] = []
 
-  category_key = cat
   if learning_profile is not None and not learning_profile.is_zero():
+    pre_floor, post_floor = _CONTEXT_FLOORS[category_key]
     dmin = float(learning_profile.min_duration_delta_by_category.get(category_key, 0.0))
     dmax = float(learning_profile.max_duration_delta_by_category.get(category_key, 0.0))
     dpre = float(learning_profile.max_pre_context_delta_by_category.get(category_key, 0.0))
     dpost = float(learning_profile.max_post_context_delta_by_category.get(category_key, 0.0))
+
     if dmin > 0:
       prof["min_duration"] = min(prof["max_duration"], prof["min_duration"] + dmin)
       profile_reasons.append("Sesuai preferensi durasi pengguna")
@@ -785,15 +935,43 @@ def _dynamic_window_profile(anchor_text: str, learning_profile: Optional[Editori
       prof["max_duration"] = max(prof["min_duration"], prof["max_duration"] + dmax)
       profile_reasons.append("Sesuai preferensi durasi pengguna")
     if dpre != 0:
-      prof["max_pre_context"] = max(2.0, prof["max_pre_context"] + dpre)
+      prof["max_pre_context"] = max(pre_floor, prof["max_pre_context"] + dpre)
       profile_reasons.append("Disesuaikan dari feedback pengguna")
     if dpost != 0:
-      prof["max_post_context"] = max(8.0, prof["max_post_context"] + dpost)
+      prof["max_post_context"] = max(post_floor, prof["max_post_context"] + dpost)
       profile_reasons.append("Disesuaikan dari feedback pengguna")
 
   return prof, _compress_reasons(profile_reasons, limit=2)
 
 
+def _dynamic_window_profile(anchor_text: str, learning_profile: Optional[EditorialLearningProfile] = None) -> Tuple[Dict[str, float], List[str]]:
+  """Pick window sizing based on the anchor's category and punchiness.
+
+  Editorial intent:
+  - Punchline: short & tight (8-18s) - ONLY exception to duration rules
+  - Educational: LONG (18-35s MINIMUM) - needs complete premise + reasoning + conclusion
+  - Hard advice: medium (12-25s) - actionable and crisp
+  - Warning: medium (15-30s) - need context for risk/consequence
+  - Lesson learned: medium-long (15-35s) - story needs breathing room
+  - Insight: medium (12-30s) - explanation with clarity
+  - Motivational: medium-short (12-25s) - punchy inspiration
+  
+  CRITICAL: min_duration is HARD MINIMUM - never produce shorter clips
+  All clips capped at 60s max (enforced elsewhere).
+  """
+  category_key = "punchline" if _is_punchline(anchor_text) else _classify(anchor_text)
+
+  cached = _PROFILE_CACHE.get(category_key)
+  if cached is not None and cached[0] is learning_profile:
+    _, prof, reasons = cached
+  else:
+    prof, reasons = _window_profile_for(category_key, learning_profile)
+    _PROFILE_CACHE[category_key] = (learning_profile, prof, reasons)
+
+  # Copies: callers receive their own dict/list to keep cached entries clean.
+  return dict(prof), list(reasons)
+
+
 def _emotional_signal_score(text: str) -> Tuple[int, List[str]]:
   """Detect emotional signals in text.
   
@@ -804,29 +982,16 @@ def _emotional_signal_score(text: str) -> Tuple[int, List[str]]:
   if not words:
     return 0, []
 
-  # Emotion lexicon: keep small, high-precision.
-  fear_urgency = {
-    "takut", "khawatir", "cemas", "panik", "bahaya", "ancam", "darurat", "segera", "urgent", "krusial",
-    "parah", "fatal", "berisiko", "resiko", "hancur",
-  }
-  success_relief = {
-    "berhasil", "sukses", "menang", "naik", "tembus", "lega", "akhirnya", "tenang", "selamat",
-  }
-  failure_frustration = {
-    "gagal", "kecewa", "frustrasi", "capek", "lelah", "stress", "stres", "marah", "kesal", "kacau",
-    "susah", "sulit", "berantakan", "nyesel", "menyerah",
-  }
-
   score = 0
   reasons: List[str] = []
 
-  if any(w in fear_urgency for w in words):
+  if any(w in _FEAR_URGENCY for w in words):
     score += 2
     reasons.append("Sinyal urgensi/risiko")
-  if any(w in success_relief for w in words):
+  if any(w in _SUCCESS_RELIEF for w in words):
     score += 1
     reasons.append("Sinyal sukses/lega")
-  if any(w in failure_frustration for w in words):
+  if any(w in _FAILURE_FRUSTRATION for w in words):
     score += 1
     reasons.append("Sinyal gagal/frustrasi")
 
@@ -850,7 +1015,33 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
   """
   words = _tokenize(text)
   n = len(words)
-  
+
+  # One pass over the tokens covers all counting needs AND every boolean
+  # lexicon check below: each token contributes its lexicon bitmask, so the
+  # per-lexicon tests collapse into bit tests on `hits`.
+  mask_of = _LEXICON_MASKS.get
+  hits = 0
+  filler_count = 0
+  stop_count = 0
+  content_count = 0
+  for w in words:
+    hits |= mask_of(w, 0)
+    in_filler = w in _FILLER_WORDS
+    in_stop = w in _STOP_WORDS
+    filler_count += in_filler
+    stop_count += in_stop
+    content_count += not (in_filler or in_stop)
+
+  # Fast disqualification: if the cheap structural penalties alone already
+  # sink the text (filler-dominated AND badly sized), skip the regex and
+  # support domains entirely. Most chunks on a typical transcript are
+  # rejected, so obvious rejects should not pay for the full pipeline.
+  if n and filler_count / n >= 0.40 and (n < 5 or n > 30):
+    quick_penalty = -4 - (3 if n < 5 else 2)
+    if quick_penalty <= -6 and not _is_punchline(text):
+      reasons = ["Terlalu banyak filler", "Terlalu pendek" if n < 5 else "Terlalu panjang"]
+      return -999, reasons
+
   core_score = 0
   support_score = 0
   penalty_score = 0
@@ -864,35 +1055,20 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
   # Measures: claim strength, declarative structure, standalone value
   
   # Declarative claim markers - strongest signal
-  declarative_patterns = [
-    r"\bkunci(nya)?\s+(itu\s+)?adalah\b",
-    r"\bintinya\s+(itu\s+)?\b",
-    r"\bartinya\s+\b",
-    r"\byang\s+terjadi\s+(itu\s+)?adalah\b",
-    r"\bpoin(nya)?\s+(itu\s+)?\b",
-    r"\bpelajaran(nya)?\s+(itu\s+)?\b",
-    r"\bmasalah\s+utamanya\s+(itu\s+)?\b",
-    r"\bsolusi(nya)?\s+(itu\s+)?\b",
-    r"\bfakta(nya)?\s+(itu\s+)?\b",
-    r"\bkenyataan(nya)?\s+(itu\s+)?\b",
-  ]
-  is_declarative = any(re.search(pat, text.lower()) for pat in declarative_patterns)
+  text_lower = text.lower()
+  lowered = text_lower.strip()
+  is_declarative = bool(_DECLARATIVE_RE.search(text_lower))
   if is_declarative:
     core_score += 4  # Strong core signal
     reasons.append("Pernyataan deklaratif kuat")
 
   # Core keywords - signal valuable insight/advice
-  core_keywords = {
-    "penting", "kunci", "kuncinya", "masalah", "solusi", "kesalahan",
-    "intinya", "sebenarnya", "faktanya", "kenyataannya", "artinya",
-  }
-  if any(w in core_keywords for w in words):
+  if hits & _HIT_CORE:
     core_score += 3
     reasons.append("Mengandung kata kunci editorial")
 
   # Assertive/instructional tone - signals actionable advice
-  imperative_markers = {"harus", "wajib", "jangan", "pastikan", "ingat", "fokus", "hindari"}
-  if any(w in imperative_markers for w in words):
+  if hits & _HIT_IMPERATIVE:
     core_score += 3
     reasons.append("Nada instruktif/tegas")
 
@@ -905,9 +1081,8 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
   # Educational clips are valuable when they contain full information flow
   if _is_educational_content(text):
     # Check for reasoning markers (indicates complete explanation, not just numbers)
-    reasoning_markers = {"artinya", "berarti", "jadi", "makanya", "hasilnya", "itulah", "begitulah"}
-    has_reasoning = any(w in reasoning_markers for w in words)
-    
+    has_reasoning = bool(hits & _HIT_REASONING)
+
     # Check for sufficient length (complete explanations need context)
     if has_reasoning and n >= 15:
       core_score += 5  # Strong educational value
@@ -917,11 +1092,9 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
       reasons.append("Konten edukasi")
 
   # Meaning density - information-rich content
-  filler, stop = _filler_and_stopwords()
   if words:
-    content_words = [w for w in words if (w not in filler and w not in stop)]
-    content_ratio = len(content_words) / len(words)
-    if content_ratio >= 0.55 and len(content_words) >= 5:
+    content_ratio = content_count / len(words)
+    if content_ratio >= 0.55 and content_count >= 5:
       core_score += 2
       reasons.append("Meaning density tinggi")
 
@@ -937,25 +1110,18 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
     reasons.extend(em_reasons[:1])  # Keep concise
 
   # Emphasis starters - signal important point
-  emphasis_starts = [
-    "jadi", "intinya", "yang paling", "ingat", "sebenarnya", "singkatnya",
-    "poin", "kunci", "masalahnya",
-  ]
-  if any(text.strip().lower().startswith(prefix) for prefix in emphasis_starts):
+  if lowered.startswith(_EMPHASIS_STARTS):
     support_score += 1
     reasons.append("Awalan penekanan")
 
   # First-person credibility
-  first_person = {"saya", "aku", "kita", "kami", "gue"}
-  if any(w in first_person for w in words):
+  if hits & _HIT_FIRST_PERSON:
     support_score += 1
     reasons.append("Insight orang pertama")
 
   # Claim + support structure
-  claim_words = {"kunci", "penting", "masalah", "solusi", "harus", "jangan", "intinya"}
-  support_words = {"karena", "sebab", "soalnya", "makanya", "jadi", "biar", "supaya"}
-  has_claim = any(w in claim_words for w in words)
-  has_support = any(w in support_words for w in words)
+  has_claim = bool(hits & _HIT_CLAIM)
+  has_support = bool(hits & _HIT_SUPPORT)
   if has_claim and has_support:
     support_score += 1
     reasons.append("Claim+justifikasi")
@@ -967,7 +1133,6 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
   
   # Filler-heavy content penalty
   if words:
-    filler_count = sum(1 for w in words if w in filler)
     filler_ratio = filler_count / len(words)
     if filler_ratio >= 0.40:
       penalty_score -= 4
@@ -977,22 +1142,16 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
       reasons.append("Cukup banyak filler")
 
   # Question penalty (unless part of rhetorical pattern)
-  lowered = text.strip().lower()
-  question_starts = {"apa", "mengapa", "kenapa", "bagaimana", "kapan", "dimana", "berapa"}
-  is_question = "?" in text or any(lowered.startswith(q) for q in question_starts)
+  is_question = "?" in text or lowered.startswith(_QUESTION_STARTS)
   if is_question:
     # Allow rhetorical questions if followed by answer signal
-    answer_markers = {"karena", "jawabannya", "ternyata", "sebenarnya", "faktanya"}
-    has_answer = any(w in answer_markers for w in words)
+    has_answer = bool(hits & _HIT_ANSWER)
     if not has_answer:
       penalty_score -= 3
       reasons.append("Pertanyaan tanpa jawaban")
 
   # Storytelling without claim penalty
-  storytelling_markers = {
-    "waktu", "dulu", "pas", "kemarin", "terus", "lalu", "kemudian", "abis", "habis",
-  }
-  has_story = any(w in storytelling_markers for w in words)
+  has_story = bool(hits & _HIT_STORY)
   # Only penalize if it's storytelling WITHOUT a takeaway
   if has_story and not has_claim and not is_declarative and n >= 8:
     penalty_score -= 3
@@ -1009,7 +1168,6 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
 
   # Stopword dominance (context-dependent, weak standalone value)
   if words:
-    stop_count = sum(1 for w in words if w in stop)
     if stop_count / len(words) >= 0.70 and core_score <= 2:
       penalty_score -= 2
       reasons.append("Terlalu banyak stopword")
@@ -1028,6 +1186,7 @@ def _score_text(text: str) -> Tuple[int, List[str]]:
   return total_score, reasons
 
 
+@lru_cache(maxsize=2048)
 def _classify(text: str) -> str:
   """Enhanced classification based on intent, not just keywords.
   
@@ -1052,66 +1211,32 @@ def _classify(text: str) -> str:
   
   # HARD ADVICE - imperative, instructional
   # Signals: must, should, don't, focus, remember
-  imperative = {"harus", "wajib", "jangan", "pastikan", "ingat", "fokus", "hindari", "lakukan"}
-  if w & imperative:
+  if not w.isdisjoint(_IMPERATIVE_SIGNALS):
     return "hard_advice"
   
   # WARNING - risk, danger, consequences
   # Signals: danger, risk, problem, mistake, avoid
-  warning_signals = {
-    "bahaya", "risiko", "resiko", "ancaman", "masalah", "kesalahan", 
-    "salah", "fatal", "hancur", "rugi", "gagal", "kacau", "berantakan",
-  }
-  caution_patterns = [
-    r"\bhati-?hati\b",
-    r"\bkalau\s+(tidak|nggak|gak)\b",
-    r"\bjangan\s+sampai\b",
-  ]
-  has_warning = (w & warning_signals) or any(re.search(p, t) for p in caution_patterns)
+  has_warning = not w.isdisjoint(_WARNING_SIGNALS) or bool(_CAUTION_RE.search(t))
   if has_warning:
     return "warning"
   
   # LESSON LEARNED - past experience, retrospective
   # Signals: I learned, when I, past tense, experience
-  lesson_patterns = [
-    r"\bsaya\s+(belajar|dapat|dapet)\b",
-    r"\bpengalaman\s+saya\b",
-    r"\bdulu\s+saya\b",
-    r"\bwaktu\s+(itu\s+)?saya\b",
-    r"\bpelajaran(nya)?\b",
-  ]
-  past_tense = {"dulu", "waktu", "pengalaman", "pelajaran", "ternyata"}
-  has_lesson = any(re.search(p, t) for p in lesson_patterns) or (w & past_tense and len(w & {"saya", "aku", "gue", "kita"}) > 0)
+  has_lesson = (
+      not w.isdisjoint(_PAST_TENSE) and not w.isdisjoint(_LESSON_FIRST_PERSON)
+  ) or bool(_LESSON_RE.search(t))
   if has_lesson:
     return "lesson_learned"
   
   # INSIGHT - understanding, explanation, "what really matters"
   # Signals: key, the point is, actually, the truth is
-  insight_signals = {
-    "kunci", "kuncinya", "intinya", "sebenarnya", "faktanya", 
-    "kenyataannya", "artinya", "poinnya", "alasannya",
-  }
-  insight_patterns = [
-    r"\byang\s+penting\b",
-    r"\byang\s+perlu\b",
-    r"\bmasalah\s+utama\b",
-  ]
-  has_insight = (w & insight_signals) or any(re.search(p, t) for p in insight_patterns)
+  has_insight = not w.isdisjoint(_INSIGHT_SIGNALS) or bool(_INSIGHT_RE.search(t))
   if has_insight:
     return "insight"
   
   # MOTIVATIONAL - encouragement, belief, inspiration
   # Signals: believe, can do it, keep going, success
-  motivational_signals = {
-    "semangat", "percaya", "yakin", "pasti", "bisa", "sukses", 
-    "berhasil", "terus", "lanjut", "jangan", "menyerah",
-  }
-  motivational_patterns = [
-    r"\bkamu\s+bisa\b",
-    r"\bpasti\s+bisa\b",
-    r"\bjangan\s+menyerah\b",
-  ]
-  has_motivational = (w & motivational_signals and len(w & motivational_signals) >= 2) or any(re.search(p, t) for p in motivational_patterns)
+  has_motivational = len(w & _MOTIVATIONAL_SIGNALS) >= 2 or bool(_MOTIVATIONAL_RE.search(t))
   if has_motivational:
     return "motivational"
   
@@ -1171,6 +1296,15 @@ def _calculate_core_editorial_pass(text: str) -> Tuple[bool, int]:
     return False, 0
   
   core_score = 0
+
+  # One pass over the tokens feeds the lexicon bitmask and the meaning
+  # density count together (same scheme as _score_text).
+  mask_of = _LEXICON_MASKS.get
+  hits = 0
+  content_count = 0
+  for w in words:
+    hits |= mask_of(w, 0)
+    content_count += w not in _FILLER_WORDS and w not in _STOP_WORDS
   
   # 0. EDUCATIONAL CONTENT CHECK (NEW!)
   # Educational content has different signals - it's valuable because of
@@ -1178,8 +1312,7 @@ def _calculate_core_editorial_pass(text: str) -> Tuple[bool, int]:
   if _is_educational_content(text):
     # Check if it's a complete educational explanation (not just isolated numbers)
     # Simple heuristic: needs reasoning markers + sufficient length
-    reasoning_markers = {"artinya", "berarti", "jadi", "makanya", "hasilnya", "itulah", "begitulah"}
-    has_reasoning = any(w in reasoning_markers for w in words)
+    has_reasoning = bool(hits & _HIT_REASONING)
     
     # Complete educational content gets immediate pass
     if has_reasoning and len(words) >= 10:
@@ -1187,40 +1320,24 @@ def _calculate_core_editorial_pass(text: str) -> Tuple[bool, int]:
     elif len(words) >= 8:
       core_score += 3  # Moderate educational signal
   
+  text_lower = text.lower()
+
   # 1. Declarative claim check
-  declarative_patterns = [
-    r"\bkunci(nya)?\s+(itu\s+)?adalah\b",
-    r"\bintinya\s+(itu\s+)?\b",
-    r"\bartinya\s+\b",
-    r"\bfakta(nya)?\s+(itu\s+)?\b",
-    r"\bkenyataan(nya)?\s+(itu\s+)?\b",
-    r"\bmasalah(nya)?\s+(itu\s+)?adalah\b",
-    r"\bsolusi(nya)?\s+(itu\s+)?\b",
-    r"\brahasia(nya)?\s+\w+\s+(itu|adalah)\b",  # "rahasia sukses itu/adalah"
-    r"\bsebenarnya\s+\w+\s+(itu|adalah)\b",     # "sebenarnya X itu/adalah"
-  ]
-  is_declarative = any(re.search(pat, text.lower()) for pat in declarative_patterns)
+  is_declarative = bool(_CORE_DECLARATIVE_RE.search(text_lower))
   if is_declarative:
     core_score += 4
   
   # 2. Assertive/instructional check
-  imperative_markers = {"harus", "wajib", "jangan", "pastikan", "ingat", "fokus", "hindari"}
-  if any(w in imperative_markers for w in words):
+  if hits & _HIT_IMPERATIVE:
     core_score += 3
   
   # 3. Core keywords check - opener words signal strong editorial anchor
-  core_openers = {"masalahnya", "kuncinya", "intinya", "sebenarnya", "faktanya", "kenyataannya", "solusinya"}
-  text_lower = text.lower()
-  has_opener = any(text_lower.startswith(opener) for opener in core_openers)
+  has_opener = text_lower.startswith(_CORE_OPENERS)
   if has_opener:
     core_score += 3
   
   # 4. Core keywords check (general)
-  core_keywords = {
-    "penting", "kunci", "kuncinya", "masalah", "solusi", "kesalahan",
-    "intinya", "sebenarnya", "faktanya", "kenyataannya", "rahasia",
-  }
-  if any(w in core_keywords for w in words):
+  if hits & _HIT_CORE_PASS:
     core_score += 2
   
   # 5. Punchline check
@@ -1228,10 +1345,8 @@ def _calculate_core_editorial_pass(text: str) -> Tuple[bool, int]:
     core_score += 3
   
   # 6. Meaning density check
-  filler, stop = _filler_and_stopwords()
-  content_words = [w for w in words if (w not in filler and w not in stop)]
-  content_ratio = len(content_words) / len(words) if words else 0
-  if content_ratio >= 0.55 and len(content_words) >= 5:
+  content_ratio = content_count / len(words)
+  if content_ratio >= 0.55 and content_count >= 5:
     core_score += 2
   
   # Pass threshold: must have core_score >= 3
@@ -1244,30 +1359,27 @@ def _merge_chunks(transcript: List[Dict], min_duration: float = 30.0, max_durati
   # Merge consecutive segments into chunks within [min_duration, max_duration]
   n = len(transcript)
   chunks: List[Dict] = []
+
+  # Prefix sums over durations: cum[k] is the total duration of segments
+  # [0, k). Both chunk boundaries below become binary searches instead of
+  # per-segment accumulation loops (the strides overlap, so segments would
+  # otherwise be re-summed several times).
+  starts = [float(seg["start"]) for seg in transcript]  # type: ignore
+  durs = [float(seg["duration"]) for seg in transcript]  # type: ignore
+  texts = [str(seg["text"]) for seg in transcript]
+  cum = [0.0]
+  cum.extend(accumulate(durs))
+
   i = 0
   while i < n:
-    j = i
-    total = 0.0
-    # Reach minimum duration
-    while j < n and total < min_duration:
-      total += float(transcript[j]["duration"])  # type: ignore
-      j += 1
-    # Extend up to max duration
-    while j < n and total < max_duration:
-      next_d = float(transcript[j]["duration"])  # type: ignore
-      if total + next_d > max_duration:
-        break
-      total += next_d
-      j += 1
+    # Smallest j reaching min_duration, then the furthest j that still fits
+    # under max_duration.
+    j = min(bisect_left(cum, cum[i] + min_duration, i + 1), n)
+    j = max(j, bisect_right(cum, cum[i] + max_duration, j) - 1)
 
-    if j <= i:
-      # Safety fallback
-      j = i + 1
-
-    start = float(transcript[i]["start"])  # type: ignore
-    last = transcript[j - 1]
-    end = float(last["start"]) + float(last["duration"])  # type: ignore
-    text = " ".join(str(seg["text"]) for seg in transcript[i:j])
+    start = starts[i]
+    end = starts[j - 1] + durs[j - 1]
+    text = " ".join(texts[i:j])
 
     chunks.append({
       "start": start,
@@ -1298,6 +1410,9 @@ def _build_window_around(
   post_roll: float,
   max_pre_context: float = 7.0,
   max_post_context: float = 10.0,
+  starts: Optional[List[float]] = None,
+  ends: Optional[List[float]] = None,
+  texts: Optional[List[str]] = None,
 ) -> Tuple[int, int, float, float]:
   """Build a time window centered around the strongest segment (anchor).
 
@@ -1313,11 +1428,61 @@ def _build_window_around(
   center_index = max(0, min(n - 1, center_index))
   l = r = center_index
 
-  def seg_start(i: int) -> float:
-    return float(transcript[i]["start"])  # type: ignore
-
-  def seg_end(i: int) -> float:
-    return float(transcript[i]["start"]) + float(transcript[i]["duration"])  # type: ignore
+  # Per-segment text pulled out of the dicts once; the expansion/trim passes
+  # below re-read the same segments many times. Callers that preprocess the
+  # texts (e.g. transcript cleaning) pass them in.
+  seg_texts = texts if texts is not None else [str(seg.get("text", "")) for seg in transcript]
+
+  # Lazily-filled per-segment features shared by the passes below. A segment
+  # can be inspected by several passes (expand, trim-left, trim-right,
+  # hanging-start rescan); each feature is computed at most once.
+  _core_feat: List[Optional[Tuple[bool, int]]] = [None] * n
+  _toks_feat: List[Optional[Tuple[str, ...]]] = [None] * n
+  _hang_feat: List[Optional[bool]] = [None] * n
+
+  def feat_core(i: int) -> Tuple[bool, int]:
+    f = _core_feat[i]
+    if f is None:
+      f = _calculate_core_editorial_pass(seg_texts[i].strip())
+      _core_feat[i] = f
+    return f
+
+  def feat_toks(i: int) -> Tuple[str, ...]:
+    t = _toks_feat[i]
+    if t is None:
+      t = _tokenize(seg_texts[i])
+      _toks_feat[i] = t
+    return t
+
+  def feat_hang(i: int) -> bool:
+    h = _hang_feat[i]
+    if h is None:
+      h = _is_hanging_start(_lower(seg_texts[i]).strip())
+      _hang_feat[i] = h
+    return h
+
+  # The concatenated window text is requested by several passes, often for the
+  # same (l, r) bounds; cache the joins so each distinct window is built once.
+  _join_cache: Dict[Tuple[int, int], str] = {}
+
+  def window_text_of(left: int, right: int) -> str:
+    key = (left, right)
+    text = _join_cache.get(key)
+    if text is None:
+      text = " ".join(seg_texts[left:right + 1])
+      _join_cache[key] = text
+    return text
+
+  # Start/end times converted out of the dicts once; the expansion loops below
+  # read them dozens of times per window. Callers that build windows around
+  # many anchors pass the arrays in so the conversion happens once per
+  # transcript rather than once per anchor.
+  if starts is None:
+    starts = [float(seg["start"]) for seg in transcript]  # type: ignore
+  if ends is None:
+    ends = [starts[i] + float(transcript[i]["duration"]) for i in range(n)]  # type: ignore
+  seg_start = starts.__getitem__
+  seg_end = ends.__getitem__
 
   anchor_start = seg_start(center_index)
   anchor_end = seg_end(center_index)
@@ -1350,22 +1515,21 @@ def _build_window_around(
   
   def is_valuable_segment(i: int) -> bool:
     """Check if segment adds editorial value (not just filler)."""
-    seg_text = str(transcript[i].get("text", "")).strip()
-    if not seg_text:
+    if not seg_texts[i].strip():
       return False
     # Quick check: does it pass core editorial requirements?
-    passes, _ = _calculate_core_editorial_pass(seg_text)
+    passes, _ = feat_core(i)
     if passes:
       return True
     # Or at least not filler-heavy
-    toks = _tokenize(seg_text)
+    toks = feat_toks(i)
     if not toks:
       return False
     filler_ratio = sum(1 for w in toks if w in filler) / len(toks)
     return filler_ratio < 0.30
 
   # Check if this is educational content - needs more aggressive expansion
-  anchor_text = str(transcript[center_index].get("text", ""))
+  anchor_text = seg_texts[center_index]
   is_educational_anchor = _is_educational_content(anchor_text) or _classify(anchor_text) == "educational"
   
   expanded = True
@@ -1381,7 +1545,7 @@ def _build_window_around(
 
     # Re-check if current window is educational (not just anchor)
     # This catches question->calculation patterns
-    window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
+    window_text = window_text_of(l, r)
     is_educational_window = is_educational_anchor or _is_educational_content(window_text)
 
     # Try expanding right (preferred to keep anchor early)
@@ -1411,7 +1575,7 @@ def _build_window_around(
   # or we hit max_duration. This is more important than keeping the anchor early.
   anchor_is_punchline = _is_punchline(anchor_text)
   if anchor_is_punchline:
-    window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
+    window_text = window_text_of(l, r)
     claim_present, reason_present, implication_present = _insight_components(window_text)
 
     # For punchlines, do not allow claim-only clips when we can fetch post-context.
@@ -1426,36 +1590,34 @@ def _build_window_around(
         r += 1
         force_steps += 1
 
-        window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
+        window_text = window_text_of(l, r)
         _, reason_present, implication_present = _insight_components(window_text)
         if reason_present or implication_present:
           break
 
   # Third pass: AGGRESSIVELY trim filler from the start
   # Editorial: Don't let weak setup dilute the hook
-  filler_starts = ("jadi", "nah", "oke", "ok", "ya", "eee", "eh", "em", "hmm", "terus", "lalu")
-  
   def is_weak_lead(i: int) -> bool:
     """Identify segments that are weak lead-ins (should be trimmed)."""
-    seg_text = str(transcript[i].get("text", "")).strip().lower()
+    seg_text = _lower(seg_texts[i]).strip()
     if not seg_text:
       return True
     
     # Don't trim if it's a strong statement
-    passes, core = _calculate_core_editorial_pass(seg_text)
+    passes, core = feat_core(i)
     if passes or core >= 3:
       return False
     
     # Trim if it's a hanging start (conjunction/connector)
-    if _is_hanging_start(seg_text):
+    if feat_hang(i):
       return True
     
     # Trim connector/filler starts
-    if seg_text.startswith(filler_starts):
+    if seg_text.startswith(_FILLER_STARTS):
       return True
     
     # Trim very filler-heavy segments
-    toks = _tokenize(seg_text)
+    toks = feat_toks(i)
     if len(toks) <= 2:
       return True
     filler_ratio = sum(1 for w in toks if w in filler) / max(1, len(toks))
@@ -1469,25 +1631,23 @@ def _build_window_around(
       break
 
   # Fourth pass: trim weak endings
-  filler_ends = {"ya", "yah", "kan", "dong", "deh", "sih", "gitu", "gini", "nih"}
-  
   def is_weak_tail(i: int) -> bool:
     """Identify segments that are weak endings (should be trimmed)."""
-    seg_text = str(transcript[i].get("text", "")).strip().lower()
+    seg_text = _lower(seg_texts[i]).strip()
     if not seg_text:
       return True
     
     # Don't trim if it's a strong statement
-    passes, core = _calculate_core_editorial_pass(seg_text)
+    passes, core = feat_core(i)
     if passes or core >= 3:
       return False
     
-    toks = _tokenize(seg_text)
+    toks = feat_toks(i)
     if len(toks) <= 2:
       return True
     
     # Trim sentences ending with filler particles
-    if toks and toks[-1] in filler_ends and len(toks) <= 6:
+    if toks and toks[-1] in _FILLER_ENDS and len(toks) <= 6:
       return True
     
     filler_ratio = sum(1 for w in toks if w in filler) / max(1, len(toks))
@@ -1505,7 +1665,7 @@ def _build_window_around(
   # This catches cases where individual segments might pass but the window starts with hanging connector
   
   # Check window-level hanging start
-  window_full_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
+  window_full_text = window_text_of(l, r)
   
   # If window starts with hanging connector, aggressively trim left
   if _is_hanging_start(window_full_text):
@@ -1514,7 +1674,7 @@ def _build_window_around(
     attempts = 0
     while l < r and attempts < max_trim_attempts:
       # Check if we can skip this segment and still have a valid clip
-      next_window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l + 1, r + 1))
+      next_window_text = window_text_of(l + 1, r)
       next_duration = seg_end(r) - seg_start(l + 1)
       next_segments = r - (l + 1) + 1
       
@@ -1538,7 +1698,7 @@ def _build_window_around(
   extension_attempts = 0
   
   while r < n - 1 and extension_attempts < max_extension_attempts:
-    window_end_text = str(transcript[r].get("text", ""))
+    window_end_text = seg_texts[r]
     end_lower = window_end_text.strip().lower()
     
     # HARD RULE: Must extend if ending is incomplete
@@ -1558,7 +1718,7 @@ def _build_window_around(
     if _is_educational_content(window_end_text) and any(char.isdigit() for char in window_end_text):
       # Check if we have a conclusion marker in next segment
       if r < n - 1:
-        next_text = str(transcript[r + 1].get("text", "")).lower()
+        next_text = _lower(seg_texts[r + 1])
         if any(marker in next_text for marker in ["itulah", "begitulah", "jadi", "kesimpulannya"]):
           needs_extension = True
     
@@ -1582,7 +1742,7 @@ def _build_window_around(
   # CRITICAL FIX: Re-check if window is educational or likely to become educational
   # Educational signals: numbers/units OR question-answer patterns OR calculation keywords
   # If educational (or likely), enforce 18s minimum duration
-  window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
+  window_text = window_text_of(l, r)
   window_lower = window_text.lower()
   
   # Check if window is educational OR has educational signals
@@ -1626,6 +1786,123 @@ def _build_window_around(
   return l, r, start, end
 
 
+# Ideal duration windows by category: (ideal_lo, ideal_hi, ideal_bonus,
+# short_cutoff, long_cutoff, out_of_range_penalty). "punchline" overrides the
+# anchor category; educational has multi-tier rules and is handled separately
+# in _duration_bonus.
+_DURATION_RULES: Dict[str, Tuple[float, float, int, float, float, int]] = {
+  "punchline": (8.0, 18.0, 2, 8.0, 25.0, -2),       # only category optimized for brevity
+  "hard_advice": (12.0, 25.0, 2, 10.0, 30.0, -1),
+  "lesson_learned": (18.0, 35.0, 2, 15.0, float("inf"), -1),  # needs story; never too long
+  "insight": (15.0, 30.0, 2, 12.0, 40.0, -1),
+  "warning": (15.0, 30.0, 2, 12.0, 40.0, -1),
+  "motivational": (15.0, 30.0, 2, 12.0, 40.0, -1),
+}
+
+
+def _duration_bonus(rule_key: str, clip_duration: float, is_complete: bool) -> int:
+  """Duration bonus/penalty for a clip, by category rule.
+
+  Editorial: prefer each category's target range. Educational is special:
+  20-35s ideal (complete premise + reasoning + conclusion), LONGER IS BETTER
+  for understanding - never penalize length short of the 60s absolute cap.
+  """
+  if rule_key == "educational":
+    bonus = 0
+    if 20.0 <= clip_duration <= 35.0:
+      bonus += 4  # Reward proper length
+      if is_complete:
+        bonus += 2  # Total +6 for ideal complete educational clip
+    elif 18.0 <= clip_duration < 20.0:
+      bonus += 2  # Still good, slightly short of ideal
+    elif clip_duration < 18.0:
+      # Should never happen thanks to GATE 1, but penalize if it does
+      bonus -= 4
+    if clip_duration > 60.0:
+      bonus -= 3
+    return bonus
+
+  lo, hi, ideal_bonus, short_cut, long_cut, out_penalty = _DURATION_RULES[rule_key]
+  if lo <= clip_duration <= hi:
+    return ideal_bonus
+  if clip_duration < short_cut or clip_duration > long_cut:
+    return out_penalty
+  return 0
+
+
+class _WindowFeatures:
+  """Lazily-computed text features for one clip window.
+
+  The gates in detect_highlights interrogate the same joined window text
+  several times (core pass, educational check, punchline check, insight
+  components, full score). Instances compute each feature on first access,
+  and detect_highlights caches them per (l, r) so neither the primary loop
+  nor the backfill repeats work for a window it has already analyzed.
+  """
+
+  __slots__ = ("text", "segments", "_core", "_is_edu", "_is_punch", "_insight", "_structure", "_scored", "_token_set", "_completeness")
+
+  def __init__(self, text: str, segments: Optional[List[str]] = None):
+    self.text = text
+    self.segments = segments if segments is not None else [text]
+    self._core = None
+    self._is_edu = None
+    self._is_punch = None
+    self._insight = None
+    self._structure = None
+    self._scored = None
+    self._token_set = None
+    self._completeness = None
+
+  @property
+  def core(self) -> Tuple[bool, int]:
+    if self._core is None:
+      self._core = _calculate_core_editorial_pass(self.text)
+    return self._core
+
+  @property
+  def is_educational(self) -> bool:
+    if self._is_edu is None:
+      self._is_edu = _is_educational_content(self.text)
+    return self._is_edu
+
+  @property
+  def is_punchline(self) -> bool:
+    if self._is_punch is None:
+      self._is_punch = _is_punchline(self.text)
+    return self._is_punch
+
+  @property
+  def insight_components(self) -> Tuple[bool, bool, bool]:
+    if self._insight is None:
+      self._insight = _insight_components(self.text)
+    return self._insight
+
+  @property
+  def insight_structure(self) -> Tuple[bool, List[str]]:
+    if self._structure is None:
+      self._structure = _has_insight_structure(self.text)
+    return self._structure
+
+  @property
+  def scored(self) -> Tuple[int, List[str]]:
+    if self._scored is None:
+      self._scored = _score_text(self.text)
+    return self._scored
+
+  @property
+  def token_set(self) -> frozenset:
+    if self._token_set is None:
+      self._token_set = frozenset(_tokenize(self.text))
+    return self._token_set
+
+  @property
+  def completeness(self) -> Tuple[bool, str]:
+    if self._completeness is None:
+      self._completeness = _check_informational_completeness(self.segments)
+    return self._completeness
+
+
 def detect_highlights(
   transcript: list[dict],
   db_session=None,
@@ -1655,29 +1932,31 @@ def detect_highlights(
   if not transcript:
     return []
 
+  # Validate shape once at the boundary: every loop below trusts that each
+  # segment is a dict with start/duration/text, so malformed entries are
+  # dropped here instead of re-checked per loop.
+  transcript = [seg for seg in transcript if isinstance(seg, dict)]
+  if not transcript:
+    return []
+
   # ============================================================
   # LOAD EDITORIAL LEARNING LAYER
   # ============================================================
   # Load historical feedback and compute bias profile
   # This is deterministic and safe (returns zero bias if no data)
   if editorial_bias is None:
-    editorial_bias = load_editorial_bias(db_session)
+    editorial_bias = load_editorial_bias_cached(db_session)
 
   # ============================================================
   # PREPROCESSING: Clean transcript artifacts
   # ============================================================
-  # Clean each segment's text while preserving timing data
-  cleaned_transcript = []
-  for seg in transcript:
-    cleaned_seg = seg.copy()
-    original_text = str(seg.get("text", ""))
-    cleaned_text = _clean_transcript_text(original_text)
-    cleaned_seg["text"] = cleaned_text
-    cleaned_seg["_original_text"] = original_text  # Keep for debugging
-    cleaned_transcript.append(cleaned_seg)
-  
-  # Use cleaned transcript for all analysis
-  transcript = cleaned_transcript
+  # Structure-of-arrays: cleaned texts live in a parallel list instead of a
+  # per-segment dict copy; timing arrays follow below. The caller's transcript
+  # is never modified, and downstream helpers receive the cleaned texts
+  # explicitly.
+  seg_texts: List[str] = _clean_transcript_texts(
+    [str(seg.get("text", "")) for seg in transcript]
+  )
 
   # Target: 3-5 high-quality clips (prefer quality over quantity)
   max_results = 5
@@ -1686,13 +1965,17 @@ def detect_highlights(
   # ============================================================
   # STEP 1: Score each segment for anchor selection
   # ============================================================
+  seg_start_times: List[float] = [float(seg["start"]) for seg in transcript]
+  seg_end_times: List[float] = [
+    seg_start_times[i] + float(transcript[i]["duration"]) for i in range(len(transcript))
+  ]
   seg_scores: List[int] = []
   seg_reasons: List[List[str]] = []
   seg_punch: List[bool] = []
   seg_core_passes: List[bool] = []
+  seg_tok_counts: List[int] = []
 
-  for seg in transcript:
-    text = str(seg.get("text", ""))
+  for text in seg_texts:
     score, reasons = _score_text(text)
     is_punch = _is_punchline(text)
     core_pass, _ = _calculate_core_editorial_pass(text)
@@ -1701,6 +1984,44 @@ def detect_highlights(
     seg_reasons.append(reasons)
     seg_punch.append(is_punch)
     seg_core_passes.append(core_pass)
+    seg_tok_counts.append(len(_tokenize(text)))
+
+  # Window features shared between the STEP 3/4 gates and the STEP 8
+  # backfill, keyed by window bounds (both paths can land on the same window).
+  _window_cache: Dict[Tuple[int, int], _WindowFeatures] = {}
+
+  def window_features(left: int, right: int) -> _WindowFeatures:
+    wf = _window_cache.get((left, right))
+    if wf is None:
+      segments = seg_texts[left:right + 1]
+      wf = _WindowFeatures(" ".join(segments), segments)
+      _window_cache[(left, right)] = wf
+    return wf
+
+  # Interval index over accepted candidates, sorted by start. Clips are
+  # capped at 60s, so only candidates starting within (start - 60, end) can
+  # overlap a new range; bisect bounds that slice instead of scanning every
+  # accepted candidate per probe.
+  cand_starts: List[float] = []
+  cand_ends: List[float] = []
+
+  def overlaps_accepted(start: float, end: float) -> bool:
+    lo = bisect_left(cand_starts, start - 60.0)
+    hi = bisect_right(cand_starts, end)
+    for k in range(lo, hi):
+      if _overlap_ratio(start, end, cand_starts[k], cand_ends[k]) >= 0.60:
+        return True
+    return False
+
+  def index_accepted(start: float, end: float) -> None:
+    k = bisect_right(cand_starts, start)
+    cand_starts.insert(k, start)
+    cand_ends.insert(k, end)
+
+  def anchor_covered(t: float) -> bool:
+    lo = bisect_left(cand_starts, t - 60.0)
+    hi = bisect_right(cand_starts, t)
+    return any(cand_ends[k] >= t for k in range(lo, hi))
 
   # ============================================================
   # STEP 2: Identify anchor candidates (local peaks + punchlines)
@@ -1724,17 +2045,22 @@ def detect_highlights(
     if s >= left and s >= right and (s > left or s > right):
       peaks.append(i)
 
-  # Ensure all punchlines and core-passing segments are considered
+  # Ensure all punchlines and core-passing segments are considered.
+  # Membership goes through a set: `i not in peaks` on the list made this
+  # O(n * peaks).
+  peak_set = set(peaks)
   for i in range(n):
-    if (seg_punch[i] or seg_core_passes[i]) and i not in peaks:
+    if (seg_punch[i] or seg_core_passes[i]) and i not in peak_set:
       peaks.append(i)
+      peak_set.add(i)
   
   # Add educational sequences as anchor candidates
   # These may have low individual scores but form complete explanations
-  educational_anchors = _detect_educational_sequences(transcript, min_length=3)
+  educational_anchors = _detect_educational_sequences(transcript, min_length=3, texts=seg_texts)
   for i in educational_anchors:
-    if i not in peaks:
+    if i not in peak_set:
       peaks.append(i)
+      peak_set.add(i)
 
   # Fallback: if no peaks found, use top scorers
   if not peaks:
@@ -1755,8 +2081,8 @@ def detect_highlights(
 
   for idx in ranked_indices:
     # Gate: only proceed if anchor has strong editorial value
-    anchor_text = str(transcript[idx].get("text", ""))
-    core_pass, core_score = _calculate_core_editorial_pass(anchor_text)
+    anchor_text = seg_texts[idx]
+    core_pass = seg_core_passes[idx]
     
     # Check if this is an educational sequence anchor
     is_edu_anchor = idx in educational_anchors
@@ -1766,6 +2092,11 @@ def detect_highlights(
     if not core_pass and not seg_punch[idx] and not is_edu_anchor:
       continue
 
+    # Fast reject: an anchor that already sits inside an accepted clip is
+    # all but guaranteed to fail the overlap dedupe after window building.
+    # Skip the profile/window/gate stack outright instead of paying for it.
+    if anchor_covered(seg_start_times[idx]):
+      continue
 
     # Get dynamic window profile based on category (+ optional feedback learning adjustments)
     prof, profile_reasons = _dynamic_window_profile(anchor_text, learning_profile=learning_profile)
@@ -1778,6 +2109,9 @@ def detect_highlights(
       post_roll=float(prof["post_roll"]),
       max_pre_context=float(prof["max_pre_context"]),
       max_post_context=float(prof["max_post_context"]),
+      starts=seg_start_times,
+      ends=seg_end_times,
+      texts=seg_texts,
     )
     
     # Enforce hard max clip length of 60s
@@ -1786,7 +2120,7 @@ def detect_highlights(
       end = start + max_clip_len
 
     # Deduplicate: skip if too similar to existing candidate
-    if any(_overlap_ratio(start, end, c["start"], c["end"]) >= 0.60 for c in candidates):
+    if overlaps_accepted(start, end):
       continue
 
     # ============================================================
@@ -1799,7 +2133,7 @@ def detect_highlights(
     
     # Determine category-specific hard minimum
     cat = _classify(anchor_text)
-    is_punch = _is_punchline(anchor_text)
+    is_punch = seg_punch[idx]
     
     if is_punch:
       hard_min = 8.0  # Only punchlines can be this short
@@ -1820,42 +2154,42 @@ def detect_highlights(
     if num_segments < 2 and clip_duration < 10.0:
       continue
     
-    # GATE 2: Score the complete clip window
-    window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
-    
-    # Core editorial check for final window
-    window_core_pass, window_core_score = _calculate_core_editorial_pass(window_text)
-    if not window_core_pass:
-      continue  # Strict: final clip must pass core check
-    
     # GATE 3: Ensure clip contains claim + support/resolution
+    # Runs before GATE 2 (cheapest rejection first): it reads precomputed
+    # per-segment arrays, while GATE 2 has to join and analyze window text.
     # Check if window has multiple meaningful segments (not just anchor)
     meaningful_segments = 0
     for i in range(l, r + 1):
-      seg_text = str(transcript[i].get("text", ""))
-      if seg_text and len(_tokenize(seg_text)) >= 3:
-        passes, _ = _calculate_core_editorial_pass(seg_text)
-        if passes or len(_tokenize(seg_text)) >= 5:
+      if seg_texts[i] and seg_tok_counts[i] >= 3:
+        if seg_core_passes[i] or seg_tok_counts[i] >= 5:
           meaningful_segments += 1
     
     # Require at least 2 meaningful segments (claim + support/resolution)
     # EXCEPTION: Educational content gets a pass if it has >= 3 total segments
     # (educational value comes from complete explanation, not standalone segments)
-    is_edu_window = _is_educational_content(window_text)
     if meaningful_segments < 2:
-      if is_edu_window and num_segments >= 3:
+      if window_features(l, r).is_educational and num_segments >= 3:
         # Educational clips with 3+ segments can proceed even if individual segments are weak
         pass
       else:
         continue
     
+    # GATE 2: Score the complete clip window
+    wf = window_features(l, r)
+    window_text = wf.text
+    is_edu_window = wf.is_educational
+    
+    # Core editorial check for final window
+    window_core_pass, window_core_score = wf.core
+    if not window_core_pass:
+      continue  # Strict: final clip must pass core check
+    
     # GATE 4: INFORMATIONAL COMPLETENESS (MANDATORY)
     # CRITICAL: Completeness overrides score - never produce incomplete clips
-    window_segment_texts = [str(transcript[i].get("text", "")) for i in range(l, r + 1)]
-    is_complete, completeness_reason = _check_informational_completeness(window_segment_texts)
+    is_complete, completeness_reason = wf.completeness
     
     # HARD RULE: Educational content MUST be complete
-    is_edu_window = _is_educational_content(window_text)
+    is_edu_window = wf.is_educational
     if is_edu_window and not is_complete:
       # Educational clips without complete information are INVALID
       continue
@@ -1879,9 +2213,9 @@ def detect_highlights(
     # Non-educational clips MUST have 2-of-3 insight components:
     # claim + (reason and/or implication). Educational clips are allowed to proceed
     # if informational completeness already passes.
-    is_punchline_clip = (seg_punch[idx] or _is_punchline(window_text))
-    insight_claim, insight_reason, insight_implication = _insight_components(window_text)
-    insight_pass, insight_reasons = _has_insight_structure(window_text)
+    is_punchline_clip = (seg_punch[idx] or wf.is_punchline)
+    insight_claim, insight_reason, insight_implication = wf.insight_components
+    insight_pass, insight_reasons = wf.insight_structure
 
     # HARD RULE: Punchlines WITHOUT reasoning or takeaway must NOT be output.
     if is_punchline_clip and insight_claim and not (insight_reason or insight_implication):
@@ -1893,12 +2227,12 @@ def detect_highlights(
     if insight_required and not insight_pass:
       continue
     
-    window_score, window_reasons = _score_text(window_text)
+    window_score, window_reasons = wf.scored
     
     # Blend anchor strength + window coherence
     # For educational content, prioritize window score (completeness matters more than individual anchor)
     # For other content, anchor is more important - it's the "money shot"
-    is_edu_window = _is_educational_content(window_text)
+    is_edu_window = wf.is_educational
     if is_edu_window:
       # Educational: window coherence (80%) + anchor (20%)
       # The complete explanation is more valuable than any single segment
@@ -1912,7 +2246,7 @@ def detect_highlights(
     # ============================================================
     
     # Punchline bonus - editorial gold
-    if seg_punch[idx] or _is_punchline(window_text):
+    if is_punchline_clip:
       base_score += 3
 
     # Hook position bonus/penalty - ensure strong line appears early
@@ -1921,53 +2255,11 @@ def detect_highlights(
     hook_bonus, hook_reason = _hook_position_score(idx, l, r, clip_duration, opening_strictness=opening_strictness)
     base_score += hook_bonus
 
-    # Duration bonuses - prefer target ranges by category
-    # CRITICAL: Never penalize long clips for educational/explanation content
-    duration_bonus = 0
-    cat = _classify(anchor_text)
+    # Duration bonuses - prefer target ranges by category (see _DURATION_RULES
+    # and _duration_bonus for the per-category editorial rationale)
     is_edu = cat == "educational"
-    
-    if seg_punch[idx] or _is_punchline(window_text):
-      # Punchlines: 8-18s ideal (only category optimized for brevity)
-      if 8.0 <= clip_duration <= 18.0:
-        duration_bonus += 2
-      elif clip_duration < 8.0 or clip_duration > 25.0:
-        duration_bonus -= 2
-    elif is_edu:
-      # Educational: 20-35s ideal (needs complete premise + reasoning + conclusion)
-      # LONGER IS BETTER for understanding - never penalize length
-      if 20.0 <= clip_duration <= 35.0:
-        duration_bonus += 4  # Increased bonus - reward proper length
-      elif 18.0 <= clip_duration < 20.0:
-        duration_bonus += 2  # Still good, slightly short of ideal
-      elif clip_duration < 18.0:
-        # Should never reach here due to GATE 1, but penalize if it does
-        duration_bonus -= 4  # Too short for educational content
-      # NO PENALTY for clips over 35s if complete (longer explanations are fine)
-      # Only penalize if exceeding absolute maximum (60s)
-      if clip_duration > 60.0:
-        duration_bonus -= 3
-      # EXTRA BONUS for complete educational clips in ideal range
-      if is_complete and 20.0 <= clip_duration <= 35.0:
-        duration_bonus += 2  # Total +6 for ideal complete educational clip
-    elif cat == "hard_advice":
-      # Hard advice: 12-25s ideal
-      if 12.0 <= clip_duration <= 25.0:
-        duration_bonus += 2
-      elif clip_duration < 10.0 or clip_duration > 30.0:
-        duration_bonus -= 1
-    elif cat == "lesson_learned":
-      # Lessons: 18-35s ideal (needs story)
-      if 18.0 <= clip_duration <= 35.0:
-        duration_bonus += 2
-      elif clip_duration < 15.0:
-        duration_bonus -= 1
-    else:
-      # insight, warning, motivational: 15-30s ideal
-      if 15.0 <= clip_duration <= 30.0:
-        duration_bonus += 2
-      elif clip_duration < 12.0 or clip_duration > 40.0:
-        duration_bonus -= 1
+    duration_bonus = _duration_bonus(
+      "punchline" if is_punchline_clip else cat, clip_duration, is_complete)
 
     base_score += duration_bonus
     
@@ -1978,11 +2270,9 @@ def detect_highlights(
         base_score += 1  # Extra bonus for complete educational clips
 
     # Claim completeness bonus
-    claim_words = {"kunci", "penting", "masalah", "solusi", "harus", "jangan", "intinya"}
-    support_words = {"karena", "sebab", "soalnya", "makanya", "jadi", "biar", "supaya"}
-    window_words = _tokenize(window_text.lower())
-    has_claim = any(w in claim_words for w in window_words)
-    has_support = any(w in support_words for w in window_words)
+    window_tokens = wf.token_set
+    has_claim = not window_tokens.isdisjoint(_CLAIM_WORDS)
+    has_support = not window_tokens.isdisjoint(_SUPPORT_WORDS)
     if has_claim and has_support:
       base_score += 1
 
@@ -2000,7 +2290,7 @@ def detect_highlights(
     # Gates will still reject clips that fail core requirements
     
     # Compute hook position for bias (anchor position relative to clip)
-    anchor_start_time = float(transcript[idx]["start"])
+    anchor_start_time = seg_start_times[idx]
     anchor_offset_in_clip = anchor_start_time - start
     hook_position = anchor_offset_in_clip / clip_duration if clip_duration > 0 else 0.5
     
@@ -2051,7 +2341,7 @@ def detect_highlights(
       continue  # Incomplete clips are invalid
     
     # Check 4: Never end on hanging transitions/questions (RE-CHECK)
-    final_segment_text = str(transcript[r].get("text", "")).strip().lower()
+    final_segment_text = _lower(seg_texts[r]).strip()
     hanging_endings = ("jadi", "artinya", "berarti", "makanya", "pertanyaannya")
     if any(final_segment_text.endswith(h) for h in hanging_endings) or "?" in final_segment_text:
       continue  # Clip ends mid-thought - invalid
@@ -2107,6 +2397,7 @@ def detect_highlights(
       "reason": reason,
       "transcript": window_text,
     })
+    index_accepted(start, end)
 
     # Stop if we have enough high-quality candidates
     if len(candidates) >= max_results:
@@ -2135,7 +2426,7 @@ def detect_highlights(
         continue
       
       # Build window
-      anchor_text = str(transcript[idx].get("text", ""))
+      anchor_text = seg_texts[idx]
       prof, profile_reasons = _dynamic_window_profile(anchor_text, learning_profile=learning_profile)
       l, r, start, end = _build_window_around(
         transcript,
@@ -2146,6 +2437,9 @@ def detect_highlights(
         post_roll=float(prof["post_roll"]),
         max_pre_context=float(prof["max_pre_context"]),
         max_post_context=float(prof["max_post_context"]),
+        starts=seg_start_times,
+        ends=seg_end_times,
+        texts=seg_texts,
       )
       
       # Cap at 60s
@@ -2153,20 +2447,21 @@ def detect_highlights(
         end = start + 60.0
       
       # Skip if overlaps existing
-      if any(_overlap_ratio(start, end, c["start"], c["end"]) >= 0.60 for c in candidates):
+      if overlaps_accepted(start, end):
         continue
       
       # Final window must ALSO pass core check
-      window_text = " ".join(str(transcript[i].get("text", "")) for i in range(l, r + 1))
-      window_core_pass, _ = _calculate_core_editorial_pass(window_text)
+      wf = window_features(l, r)
+      window_text = wf.text
+      window_core_pass, _ = wf.core
       if not window_core_pass:
         continue
 
       # Insight Completion Layer (same rules as primary path)
-      is_edu_window = _is_educational_content(window_text)
-      is_punchline_clip = _is_punchline(window_text)
-      insight_claim, insight_reason, insight_implication = _insight_components(window_text)
-      insight_pass, insight_reasons = _has_insight_structure(window_text)
+      is_edu_window = wf.is_educational
+      is_punchline_clip = wf.is_punchline
+      insight_claim, insight_reason, insight_implication = wf.insight_components
+      insight_pass, insight_reasons = wf.insight_structure
 
       if is_punchline_clip and insight_claim and not (insight_reason or insight_implication):
         continue
@@ -2174,7 +2469,7 @@ def detect_highlights(
       if insight_required and not insight_pass:
         continue
       
-      window_score, _ = _score_text(window_text)
+      window_score, _ = wf.scored
       score = int(round(0.70 * seg_scores[idx] + 0.30 * window_score))
 
       if insight_claim and insight_reason and insight_implication:
@@ -2188,6 +2483,7 @@ def detect_highlights(
         "reason": "Backfill berkualitas (lulus core check)" + ("; " + "; ".join(profile_reasons) if profile_reasons else "") + ("; Insight lengkap" if (insight_claim and insight_reason and insight_implication) else ""),
         "transcript": window_text,
       })
+      index_accepted(start, end)
 
   # ============================================================
   # STEP 9: Sort and filter final results
@@ -1,11 +1,16 @@
+import asyncio
 import os
+import re
+import threading
 from typing import Iterable, List, Dict, Optional
-from sqlalchemy import insert, select, delete
+from sqlalchemy import delete
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from youtube_transcript_api import YouTubeTranscriptApi
 from yt_dlp import YoutubeDL
 from faster_whisper import WhisperModel
-from urllib.request import urlopen
+import json
+from urllib.request import urlopen, Request
 from app.database.models import Transcript
 
 
@@ -13,7 +18,7 @@ def fetch_transcript(video_id: str) -> list[dict]:
     """
     Pipeline untuk mengambil transcript:
     1) youtube_transcript_api
-    2) yt-dlp automatic captions (VTT/SRT)
+    2) Automatic captions dari halaman watch (fallback yt-dlp)
     3) Download audio dan transcribe dengan Faster-Whisper
     """
     # 1) youtube_transcript_api (prefer Indonesian, fallback English)
@@ -26,8 +31,10 @@ def fetch_transcript(video_id: str) -> list[dict]:
             # continue to next fallback
             pass
 
-    # 2) yt-dlp automatic captions
-    auto = _fetch_auto_captions_via_ytdlp(video_id)
+    # 2) automatic captions: halaman watch dulu (1 GET), fallback yt-dlp
+    auto = _fetch_auto_captions_via_watch_page(video_id)
+    if not auto:
+        auto = _fetch_auto_captions_via_ytdlp(video_id)
     if auto:
         return auto
 
@@ -39,71 +46,130 @@ def fetch_transcript(video_id: str) -> list[dict]:
     raise RuntimeError("Gagal mengambil transcript dari semua sumber")
 
 
-def _parse_timestamp(ts: str) -> float:
-    # Supports 'HH:MM:SS.mmm' and 'HH:MM:SS,mmm'
-    ts = ts.strip().replace(",", ".")
-    parts = ts.split(":")
-    if len(parts) == 3:
-        h, m, s = parts
-        return int(h) * 3600 + int(m) * 60 + float(s)
-    elif len(parts) == 2:
-        m, s = parts
-        return int(m) * 60 + float(s)
-    return float(parts[0])
+async def afetch_transcript(video_id: str) -> list[dict]:
+    """
+    Versi async dari fetch_transcript untuk route handler FastAPI.
 
+    Setiap tahap pipeline tetap sinkron tapi dijalankan di worker thread
+    lewat asyncio.to_thread, jadi event loop tidak terblokir saat download
+    caption atau transcribe audio yang bisa puluhan detik.
+    """
+    # 1) youtube_transcript_api (prefer Indonesian, fallback English)
+    api = YouTubeTranscriptApi
+    get_one = getattr(api, "get_transcript", None)
+    if callable(get_one):
+        try:
+            return await asyncio.to_thread(
+                get_one, video_id, languages=["id", "en"]
+            )  # type: ignore
+        except Exception:
+            # continue to next fallback
+            pass
 
-def _parse_vtt(vtt_text: str) -> List[Dict]:
-    lines = [l.rstrip("\n") for l in vtt_text.splitlines()]
-    entries: List[Dict] = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        i += 1
-        if not line or line.upper().startswith("WEBVTT"):
-            continue
-        if "-->" in line:
-            start_s, end_s = [p.strip() for p in line.split("-->")]
-            start = _parse_timestamp(start_s)
-            end = _parse_timestamp(end_s)
-            text_parts = []
-            while i < len(lines) and lines[i].strip():
-                text_parts.append(lines[i].strip())
-                i += 1
-            text = " ".join(text_parts)
-            entries.append({"start": start, "duration": max(0.0, end - start), "text": text})
-        # skip blank separator
-        while i < len(lines) and not lines[i].strip():
-            i += 1
-    return entries
+    # 2) automatic captions: halaman watch dulu (1 GET), fallback yt-dlp
+    auto = await asyncio.to_thread(_fetch_auto_captions_via_watch_page, video_id)
+    if not auto:
+        auto = await asyncio.to_thread(_fetch_auto_captions_via_ytdlp, video_id)
+    if auto:
+        return auto
 
+    # 3) Faster-Whisper transcription from audio
+    audio_transcript = await asyncio.to_thread(_transcribe_audio_with_whisper, video_id)
+    if audio_transcript:
+        return audio_transcript
+
+    raise RuntimeError("Gagal mengambil transcript dari semua sumber")
 
-def _parse_srt(srt_text: str) -> List[Dict]:
-    lines = [l.rstrip("\n") for l in srt_text.splitlines()]
+
+# Satu cue VTT/SRT: timestamp line (jam opsional, pemisah ms titik/koma,
+# cue settings VTT di belakang diabaikan) diikuti blok teks sampai baris kosong
+_CUE_RE = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{3})"
+    r"[ \t]*-->[ \t]*"
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{3})"
+    r"[^\n]*\n?"
+    r"(.*?)(?=\n[ \t]*\n|\Z)",
+    re.DOTALL,
+)
+
+
+def _parse_cues(text: str) -> List[Dict]:
+    """
+    Parse semua cue VTT/SRT dalam satu sweep regex.
+
+    Satu finditer menggantikan loop baris-per-baris + _parse_timestamp per
+    cue; detik dihitung langsung dari grup digit. Header WEBVTT dan baris
+    index SRT otomatis terlewati karena tidak cocok dengan pola cue.
+    """
     entries: List[Dict] = []
-    i = 0
-    while i < len(lines):
-        # skip index line
-        if lines[i].strip().isdigit():
-            i += 1
-        if i >= len(lines):
-            break
-        if "-->" in lines[i]:
-            start_s, end_s = [p.strip() for p in lines[i].split("-->")]
-            start = _parse_timestamp(start_s)
-            end = _parse_timestamp(end_s)
-            i += 1
-            text_parts = []
-            while i < len(lines) and lines[i].strip():
-                text_parts.append(lines[i].strip())
-                i += 1
-            text = " ".join(text_parts)
-            entries.append({"start": start, "duration": max(0.0, end - start), "text": text})
-        # skip blank separator
-        while i < len(lines) and not lines[i].strip():
-            i += 1
+    for m in _CUE_RE.finditer(text):
+        h1, m1, s1, ms1, h2, m2, s2, ms2, block = m.groups()
+        start = int(h1 or 0) * 3600 + int(m1) * 60 + int(s1) + int(ms1) / 1000.0
+        end = int(h2 or 0) * 3600 + int(m2) * 60 + int(s2) + int(ms2) / 1000.0
+        entries.append({
+            "start": start,
+            "duration": max(0.0, end - start),
+            "text": " ".join(block.split()),
+        })
     return entries
 
 
+# Blob ytInitialPlayerResponse di halaman watch; cukup untuk menemukan
+# captionTracks tanpa menjalankan extractor yt-dlp yang mahal
+_PLAYER_RESP_RE = re.compile(rb"ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;", re.DOTALL)
+
+_CAPTION_LANGS = ("id", "id-ID", "en", "en-US")
+
+
+def _fetch_auto_captions_via_watch_page(video_id: str) -> Optional[List[Dict]]:
+    """
+    Ambil caption dengan satu GET halaman watch.
+
+    yt-dlp extract_info membuat banyak request HTTP + interpreter JS hanya
+    untuk membaca daftar caption; URL track sebenarnya sudah ada di blob
+    ytInitialPlayerResponse. Return None kalau halaman berubah format,
+    caller jatuh ke fallback yt-dlp.
+    """
+    url = f"https://www.youtube.com/watch?v={video_id}"
+    req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
+    try:
+        with urlopen(req) as resp:
+            html = resp.read()
+    except Exception:
+        return None
+
+    m = _PLAYER_RESP_RE.search(html)
+    if not m:
+        return None
+    try:
+        data = json.loads(m.group(1))
+        tracks = data["captions"]["playerCaptionsTracklistRenderer"]["captionTracks"]
+    except Exception:
+        return None
+
+    base_urls: Dict[str, str] = {}
+    for track in tracks:
+        lang = track.get("languageCode")
+        base = track.get("baseUrl")
+        if lang and base and lang not in base_urls:
+            base_urls[lang] = base
+
+    # prefer Indonesian then English
+    for lang in _CAPTION_LANGS:
+        base = base_urls.get(lang)
+        if not base:
+            continue
+        try:
+            with urlopen(base + "&fmt=vtt") as resp:
+                vtt = resp.read().decode("utf-8", errors="ignore")
+        except Exception:
+            continue
+        entries = _parse_cues(vtt)
+        if entries:
+            return entries
+    return None
+
+
 def _fetch_auto_captions_via_ytdlp(video_id: str) -> Optional[List[Dict]]:
     url = f"https://www.youtube.com/watch?v={video_id}"
     opts = {"quiet": True}
@@ -115,7 +181,7 @@ def _fetch_auto_captions_via_ytdlp(video_id: str) -> Optional[List[Dict]]:
 
     caps = info.get("automatic_captions") or {}
     # prefer Indonesian then English
-    for lang in ("id", "id-ID", "en", "en-US"):
+    for lang in _CAPTION_LANGS:
         if lang in caps:
             formats = caps[lang]
             # choose vtt first, else srt, else any
@@ -128,15 +194,34 @@ def _fetch_auto_captions_via_ytdlp(video_id: str) -> Optional[List[Dict]]:
                         data = resp.read().decode("utf-8", errors="ignore")
                 except Exception:
                     continue
-                if fmt.get("ext") == "srt":
-                    entries = _parse_srt(data)
-                else:
-                    entries = _parse_vtt(data)
+                entries = _parse_cues(data)
                 if entries:
                     return entries
     return None
 
 
+# Faster-Whisper model dimuat sekali dan dipakai ulang antar request;
+# load weight + init CTranslate2 jauh lebih mahal daripada transcribe
+# untuk klip pendek.
+_WHISPER: Optional[WhisperModel] = None
+_WHISPER_LOCK = threading.Lock()
+
+
+def _get_whisper() -> WhisperModel:
+    global _WHISPER
+    if _WHISPER is None:
+        with _WHISPER_LOCK:
+            if _WHISPER is None:
+                _WHISPER = WhisperModel(
+                    "tiny",
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=os.cpu_count() or 4,
+                    num_workers=1,
+                )
+    return _WHISPER
+
+
 def _transcribe_audio_with_whisper(video_id: str) -> Optional[List[Dict]]:
     # Download best audio only
     url = f"https://www.youtube.com/watch?v={video_id}"
@@ -163,9 +248,16 @@ def _transcribe_audio_with_whisper(video_id: str) -> Optional[List[Dict]]:
         return None
 
     # Transcribe with Faster-Whisper (tiny model for speed)
+    # vad_filter skips silent stretches; beam_size=1 = greedy decoding
     try:
-        model = WhisperModel("tiny", device="cpu")
-        segments, _ = model.transcribe(path, language="id", task="transcribe")
+        model = _get_whisper()
+        segments, _ = model.transcribe(
+            path,
+            language="id",
+            task="transcribe",
+            vad_filter=True,
+            beam_size=1,
+        )
     except Exception:
         return None
 
@@ -183,11 +275,6 @@ async def save_transcript(
     video_id: str,
     transcript: Iterable[dict]
 ) -> None:
-    # Upsert strategy: delete existing rows for this video_id, then bulk insert
-    await session.execute(
-        delete(Transcript).where(Transcript.video_id == video_id)
-    )
-
     rows = [
         {
             "video_id": video_id,
@@ -199,10 +286,30 @@ async def save_transcript(
     ]
 
     if not rows:
+        # Nothing fetched; keep whatever is already stored
         return
 
-    # Do not open a new transaction block; an implicit transaction
-    # may already be active on this AsyncSession (due to the SELECT above).
-    # Instead, execute and explicitly commit once.
-    await session.execute(insert(Transcript), rows)
+    # Upsert on the (video_id, start) unique key: re-fetching a video from
+    # the same source keeps cue start times stable, so existing rows are
+    # updated in place instead of delete-all + reinsert (no bulk DELETE
+    # locking phase). Each chunk compiles to one multi-row VALUES statement,
+    # sized to stay below MySQL's max_allowed_packet.
+    chunk_size = 1000
+    for i in range(0, len(rows), chunk_size):
+        stmt = mysql_insert(Transcript).values(rows[i:i + chunk_size])
+        stmt = stmt.on_duplicate_key_update(
+            duration=stmt.inserted.duration,
+            text=stmt.inserted.text,
+        )
+        await session.execute(stmt)
+
+    # A re-fetched transcript can be shorter than the stored one; drop the
+    # stale tail past the new final segment.
+    max_start = max(r["start"] for r in rows)
+    await session.execute(
+        delete(Transcript).where(
+            Transcript.video_id == video_id,
+            Transcript.start > max_start,
+        )
+    )
     await session.commit()
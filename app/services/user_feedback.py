@@ -15,11 +15,15 @@ Design notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import json
+import sys
 
 
-WEAKNESS_TYPES = {
+# frozenset + interned members: membership and equality checks during
+# normalization reduce to pointer compares for canonical values
+WEAKNESS_TYPES = frozenset(map(sys.intern, (
   "too_short",
   "too_long",
   "weak_opening",
@@ -29,9 +33,9 @@ WEAKNESS_TYPES = {
   "missing_reasoning",
   "no_takeaway",
   "too_much_context",
-}
+)))
 
-STRENGTH_TYPES = {
+STRENGTH_TYPES = frozenset(map(sys.intern, (
   "strong_opening",
   "clear_insight",
   "good_duration",
@@ -39,13 +43,18 @@ STRENGTH_TYPES = {
   "clear_takeaway",
   "standalone_value",
   "good_topic",
-}
+)))
 
 # Backward-compatible aliases (older internal names or earlier drafts)
 _STRENGTH_ALIASES = {
-  "good_topic_choice": "good_topic",
+  "good_topic_choice": sys.intern("good_topic"),
 }
 
+# Canonical sort rank per enum value; sorting by one dict lookup avoids
+# repeated full string comparisons (the two enum sets share no members,
+# so one combined table keeps alphabetical order within each set)
+_ENUM_ORDER = {v: i for i, v in enumerate(sorted(WEAKNESS_TYPES | STRENGTH_TYPES))}
+
 
 @dataclass(frozen=True)
 class ValidatedFeedback:
@@ -56,7 +65,7 @@ class ValidatedFeedback:
   notes: Optional[str]
 
 
-def _normalize_enum_list(values: Optional[List[str]], allowed: set[str], aliases: Optional[Dict[str, str]] = None) -> List[str]:
+def _normalize_enum_list(values: Optional[List[str]], allowed: frozenset[str], aliases: Optional[Dict[str, str]] = None) -> List[str]:
   if not values:
     return []
   if not isinstance(values, list):
@@ -74,10 +83,10 @@ def _normalize_enum_list(values: Optional[List[str]], allowed: set[str], aliases
       key = aliases[key]
     if key not in allowed:
       raise ValueError(f"invalid enum value: {key}")
-    normalized.append(key)
+    normalized.append(sys.intern(key))
 
-  # Deterministic order: unique + sorted
-  return sorted(set(normalized))
+  # Deterministic order: unique + sorted (by precomputed rank)
+  return sorted(set(normalized), key=_ENUM_ORDER.__getitem__)
 
 
 def validate_user_feedback(data: Dict[str, Any]) -> ValidatedFeedback:
@@ -129,6 +138,16 @@ def validate_user_feedback(data: Dict[str, Any]) -> ValidatedFeedback:
   )
 
 
+@lru_cache(maxsize=1024)
+def _encode_tags(tags: tuple) -> str:
+  """JSON-encode a normalized tag tuple once per distinct combination.
+
+  _normalize_enum_list already returns sorted unique values, so identical
+  submissions share one cached string instead of re-running json.dumps.
+  """
+  return json.dumps(list(tags), ensure_ascii=False)
+
+
 def save_user_feedback(feedback: ValidatedFeedback, db_session=None) -> None:
   """Persist validated feedback.
 
@@ -146,8 +165,8 @@ def save_user_feedback(feedback: ValidatedFeedback, db_session=None) -> None:
   row = ClipUserFeedback(
     clip_id=feedback.clip_id,
     rating=feedback.rating,
-    weaknesses=json.dumps(feedback.weaknesses, ensure_ascii=False),
-    strengths=json.dumps(feedback.strengths, ensure_ascii=False),
+    weaknesses=_encode_tags(tuple(feedback.weaknesses)),
+    strengths=_encode_tags(tuple(feedback.strengths)),
     notes=feedback.notes,
   )
 
@@ -1,6 +1,12 @@
 import re
+import string
 from urllib.parse import urlparse, parse_qs
 
+# Dikompilasi sekali di import; route memanggil ini di tiap request
+_PATH_ID_RE = re.compile(r"/(?:shorts|embed|v)/([0-9A-Za-z_-]{11})")
+_ANY_ID_RE = re.compile(r"[0-9A-Za-z_-]{11}")
+_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 
 def extract_video_id(url: str) -> str:
     """
@@ -26,21 +32,21 @@ def extract_video_id(url: str) -> str:
         if vid:
             return vid
         # /shorts/VIDEOID or /embed/VIDEOID or /v/VIDEOID
-        m = re.search(r"/(shorts|embed|v)/([0-9A-Za-z_-]{11})", parsed.path or "")
+        m = _PATH_ID_RE.search(parsed.path or "")
         if m:
-            return m.group(2)
+            return m.group(1)
 
-    # youtu.be/VIDEOID
+    # youtu.be/VIDEOID — fast path, no regex needed
     if host == "youtu.be":
         # Path might be '/VIDEOID'
         path_id = (parsed.path or "").lstrip("/")
-        if re.fullmatch(r"[0-9A-Za-z_-]{11}", path_id or ""):
+        if len(path_id) == 11 and _ID_CHARS.issuperset(path_id):
             return path_id
 
     # Fallback: try to find 11-char ID anywhere in the string
-    m = re.search(r"([0-9A-Za-z_-]{11})", url)
+    m = _ANY_ID_RE.search(url)
     if m:
-        return m.group(1)
+        return m.group(0)
 
     raise ValueError("URL YouTube tidak valid atau ID tidak ditemukan")
 